@@ -36,21 +36,444 @@ To run the application:
 """
 
 import os
+import threading
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
+from typing import Iterator, Optional, Tuple
 
-import requests
-from deepdiff import DeepDiff
 from dotenv import load_dotenv
-import json
+import orjson
 import streamlit as st
 from json_inspector import (
     is_json_related, format_json, compare_json, json_to_csv,
-    generate_types, generate_mock_data
+    generate_types, generate_mock_data, fingerprint, dumps_json, loads_json
 )
 
 # Cargar variables de entorno
 load_dotenv()
 
+GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
+
+# Cantidad de respuestas de la IA que se conservan en caché
+AI_CACHE_SIZE = 256
+
+# Segundos durante los que una respuesta de la IA en caché sigue siendo válida
+AI_CACHE_TTL = 3600
+
+# Peticiones por minuto que se permiten hacia Groq, según el plan de la cuenta
+GROQ_REQUESTS_PER_MINUTE = 30
+
+# Cantidad máxima de entradas que se conservan en el historial de JSON
+HISTORY_MAX_SIZE = 50
+
+# Tamaño máximo (en caracteres) de un JSON que se muestra completo en el historial
+JSON_PREVIEW_LIMIT = 20_000
+
+# Cantidad máxima de diferencias que se muestran al comparar dos JSON; la
+# comparación se detiene al encontrarlas
+COMPARE_MAX_DIFFS = 500
+
+
+@st.cache_resource(show_spinner=False)
+def get_session():
+    """Obtener la sesión HTTP compartida para las peticiones a Groq.
+
+    Streamlit vuelve a ejecutar este script en cada interacción, así que la
+    sesión se guarda con `st.cache_resource` para reutilizar las conexiones
+    TLS entre preguntas y sesiones. `requests` se importa aquí y no al inicio
+    del módulo para no pagar su carga mientras no se use la IA. La sesión
+    reintenta con backoff exponencial ante límites de tasa y errores del
+    servidor, respetando la cabecera Retry-After de las respuestas 429.
+
+    Returns:
+        requests.Session: Sesión configurada
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+        respect_retry_after_header=True,
+    )
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry),
+    )
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+# Partes fijas del cuerpo de las peticiones a Groq; solo cambia el mensaje del usuario
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "Eres un experto analista de datos JSON. No respondas nada que no esté relacionado directamente con el JSON."
+}
+_PAYLOAD_TEMPLATE = {
+    "model": "llama-3.3-70b-versatile",
+    "temperature": 0.3,
+    "stream": True,
+}
+
+
+def iter_stream_content(response) -> Iterator[str]:
+    """Extraer los fragmentos de texto de una respuesta SSE de Groq.
+
+    Después de "[DONE]" se sigue leyendo hasta el final del cuerpo, para que
+    urllib3 devuelva la conexión al pool de la sesión.
+
+    Args:
+        response: Respuesta de `requests` abierta con `stream=True`
+
+    Yields:
+        str: Fragmentos de contenido a medida que llegan
+    """
+    done = False
+    for line in response.iter_lines():
+        if done or not line.startswith(b"data: "):
+            continue
+        payload = line[len(b"data: "):]
+        if payload == b"[DONE]":
+            done = True
+            continue
+        for choice in orjson.loads(payload).get("choices", []):
+            content = choice.get("delta", {}).get("content")
+            if content:
+                yield content
+
+
+@st.cache_resource(show_spinner=False)
+def get_ai_cache() -> Tuple[OrderedDict, threading.Lock]:
+    """Obtener la caché LRU de respuestas de la IA.
+
+    La caché vive en el proceso de Streamlit, por lo que se comparte entre
+    ejecuciones y sesiones; el lock la protege de accesos concurrentes.
+
+    Returns:
+        Tuple[OrderedDict, threading.Lock]: (respuestas, lock)
+    """
+    return OrderedDict(), threading.Lock()
+
+
+class TokenBucket:
+    """Limitador de tasa tipo token bucket, seguro entre hilos.
+
+    Se recupera un token cada `60 / per_minute` segundos hasta un máximo de
+    `per_minute`, lo que permite ráfagas cortas sin superar la tasa media.
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Consumir un token si hay alguno disponible.
+
+        Returns:
+            bool: True si se puede hacer la petición
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+@st.cache_resource(show_spinner=False)
+def get_rate_limiter() -> TokenBucket:
+    """Obtener el limitador de peticiones a Groq compartido por todas las sesiones.
+
+    Returns:
+        TokenBucket: Limitador con capacidad GROQ_REQUESTS_PER_MINUTE
+    """
+    return TokenBucket(GROQ_REQUESTS_PER_MINUTE)
+
+
+def get_cached_answer(key: tuple) -> Optional[str]:
+    """Buscar una respuesta de la IA en la caché.
+
+    Args:
+        key: Clave devuelta por `ai_cache_key`
+
+    Returns:
+        Optional[str]: Respuesta guardada o None si no existe o ha caducado
+    """
+    cache, lock = get_ai_cache()
+    with lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        stored_at, answer = entry
+        if time.time() - stored_at > AI_CACHE_TTL:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return answer
+
+
+def store_answer(key: tuple, answer: str) -> None:
+    """Guardar una respuesta de la IA en la caché, descartando la más antigua.
+
+    Args:
+        key: Clave devuelta por `ai_cache_key`
+        answer: Respuesta completa de la IA
+    """
+    cache, lock = get_ai_cache()
+    with lock:
+        cache[key] = (time.time(), answer)
+        cache.move_to_end(key)
+        if len(cache) > AI_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def ai_cache_key(api_key: str, question: str, json_data: dict) -> tuple:
+    """Construir la clave de caché de una pregunta a la IA.
+
+    La API key solo forma parte de la clave como huella, para no guardarla
+    en la caché.
+
+    Args:
+        api_key: API key de Groq
+        question: Pregunta del usuario
+        json_data: Datos JSON a analizar
+
+    Returns:
+        tuple: Clave de caché
+    """
+    return fingerprint(api_key), question, fingerprint(json_data)
+
+
+def history_timestamp(item: dict) -> str:
+    """Obtener la fecha legible de una entrada del historial.
+
+    La fecha se formatea la primera vez que se muestra y queda guardada en
+    la entrada como "timestamp".
+
+    Args:
+        item: Entrada del historial con la marca de tiempo "ts"
+
+    Returns:
+        str: Fecha con formato "YYYY-MM-DD HH:MM:SS"
+    """
+    if "timestamp" not in item:
+        item["timestamp"] = datetime.fromtimestamp(item["ts"]).isoformat(
+            sep=" ", timespec="seconds"
+        )
+    return item["timestamp"]
+
+
+def history_preview(item: dict) -> str:
+    """Obtener la vista previa truncada de una entrada del historial.
+
+    El recorte se hace la primera vez que se muestra y queda guardado en la
+    entrada como "preview", para no copiar el texto en cada ejecución.
+
+    Args:
+        item: Entrada del historial con el JSON serializado en "formatted"
+
+    Returns:
+        str: Primeros JSON_PREVIEW_LIMIT caracteres seguidos de "..."
+    """
+    if "preview" not in item:
+        item["preview"] = item["formatted"][:JSON_PREVIEW_LIMIT] + "\n..."
+    return item["preview"]
+
+
+# Versiones en caché de las funciones de json_inspector: Streamlit indexa los
+# resultados por el texto de entrada, así que repetir una acción no vuelve a
+# procesarlo
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_format_json(json_str: str):
+    """Versión en caché de `format_json`."""
+    return format_json(json_str)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_compare_json(json_a: str, json_b: str, max_diffs: Optional[int] = None):
+    """Versión en caché de `compare_json`; `max_diffs` forma parte de la clave."""
+    return compare_json(json_a, json_b, max_diffs)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_json_to_csv(json_str: str):
+    """Versión en caché de `json_to_csv`."""
+    return json_to_csv(json_str)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_generate_types(json_str: str, base_name: str):
+    """Versión en caché de `generate_types`."""
+    return generate_types(json_str, base_name)
+
+
+# Textos de la interfaz por idioma
+TEXTS = {
+    "Español": {
+        "mock_data_input": "Estructura JSON para generar datos",
+        "mock_data_records": "Cantidad de registros",
+        "generate_mock_btn": "Generar datos",
+        "title": "JSON AI Inspector",
+        "json_input": "Ingresa tu JSON",
+        "format_btn": "Formatear JSON",
+        "export_csv_btn": "Exportar a CSV",
+        "csv_success": "JSON exportado a CSV correctamente",
+        "csv_error": "Error al exportar a CSV",
+        "generate_types_btn": "Generar Tipos",
+        "types_title": "Tipos Generados",
+        "python_tab": "Python",
+        "typescript_tab": "TypeScript",
+        "golang_tab": "Golang",
+        "types_error": "Error al generar tipos",
+        "base_name_label": "Nombre base para los tipos",
+        "question_label": "Pregunta sobre el JSON",
+        "ask_btn": "Preguntar a la IA",
+        "no_api_key": "No se ha configurado la API key de Groq",
+        "invalid_json": "JSON inválido",
+        "json_formatted": "JSON formateado correctamente",
+        "json_saved": "JSON guardado en el historial",
+        "history_title": "Historial de JSON",
+        "history_empty": "No hay JSON en el historial",
+        "json_equal": "Los JSON son iguales",
+        "json_different": "Los JSON son diferentes",
+        "compare_title": "Comparar JSON",
+        "json_input1": "JSON 1",
+        "json_input2": "JSON 2",
+        "compare_btn": "Comparar",
+        "identical_jsons": "Los JSON son idénticos",
+        "different_jsons": "Los JSON son diferentes",
+        "diff_limit_msg": "Se muestran solo las primeras {count} diferencias.",
+        "donate": "Apoya el proyecto 💖",
+        "limit_msg": "Has alcanzado el límite gratuito de preguntas IA.",
+        "rate_limit_msg": "Demasiadas preguntas seguidas; espera unos segundos e inténtalo de nuevo.",
+        "invalid_question": "❌ La pregunta no parece estar relacionada con el JSON. Reformúlala.",
+        "mock_data_title": "Mock Data Generator",
+        "mock_data_description": "Generate mock data based on JSON structure",
+        "mock_data_example_title": "Example Structure",
+        "mock_data_example_description": "Define data types using a JSON structure. Supported types: string, integer, number, boolean, date, email, phone, url, objectId, array<type>",
+        "mock_data_input": "JSON structure for generating data",
+        "mock_data_btn": "Generate Data",
+        "mock_data_records": "Number of records",
+        "mock_data_success": "Data generated successfully",
+        "mock_data_error": "Error generating data",
+        "mock_data_export": "Export JSON",
+        "mock_data_history": "Data History",
+        "mock_data_help": "Help",
+        "mock_data_help_text": "Use this generator to create mock data based on a JSON structure. Define data types using a simple JSON structure.",
+        "ai_assistant_title": "Asistente de IA",
+        "ai_assistant_prompt": "Puedes preguntar sobre el JSON más reciente",
+        "response_label": "Respuesta",
+        "error_label": "Error",
+        "question_placeholder": "Escribe tu pregunta para AI aquí...",
+        "show_full_json": "Mostrar JSON completo",
+        "history_date_col": "Fecha",
+        "history_size_col": "Caracteres",
+        "history_select_hint": "Selecciona una fila para ver el JSON"
+    },
+    "English": {
+        "mock_data_input": "Enter the JSON structure",
+        "mock_data_records": "Number of records",
+        "generate_mock_btn": "Generate Data",
+        "title": "JSON AI Inspector",
+        "json_input": "Enter your JSON",
+        "format_btn": "Format JSON",
+        "export_csv_btn": "Export to CSV",
+        "csv_success": "JSON exported to CSV successfully",
+        "csv_error": "Error exporting to CSV",
+        "question_label": "Question about the JSON",
+        "ask_btn": "Ask AI",
+        "no_api_key": "Groq API key not configured",
+        "invalid_json": "Invalid JSON",
+        "json_formatted": "JSON formatted successfully",
+        "json_saved": "JSON saved to history",
+        "history_title": "JSON History",
+        "history_empty": "No JSON in history",
+        "json_equal": "The JSONs are equal",
+        "json_different": "The JSONs are different",
+        "compare_title": "Compare JSON",
+        "json_input1": "JSON 1",
+        "json_input2": "JSON 2",
+        "compare_btn": "Compare",
+        "identical_jsons": "The JSONs are identical",
+        "different_jsons": "The JSONs are different",
+        "diff_limit_msg": "Only the first {count} differences are shown.",
+        "donate": "Support the project 💖",
+        "limit_msg": "You have reached the free usage limit for AI questions.",
+        "rate_limit_msg": "Too many questions in a row; wait a few seconds and try again.",
+        "invalid_question": "❌ The question doesn't seem to be related to JSON. Please rephrase it.",
+        "generate_types_btn": "Generate Types",
+        "types_title": "Generated Types",
+        "python_tab": "Python",
+        "typescript_tab": "TypeScript",
+        "golang_tab": "Golang",
+        "types_error": "Error generating types",
+        "base_name_label": "Base name for types",
+        "mock_data_title": "3. Data Generation",
+        "mock_data_description": "Generate dummy data based on JSON structure.",
+        "mock_data_input": "Enter the JSON structure",
+        "mock_data_example_title": "Example Structure",
+        "mock_data_example_description": "You can use this structure as a base and modify it according to your needs. Supported types are: string, integer, number, boolean, date, email, phone, url, objectId and array<type>.",
+        "num_records_label": "Number of records (max. 1000)",
+        "mock_data_records": "Number of records",
+        "mock_data_btn": "Generate Data",
+        "mock_data_success": "Data generated successfully",
+        "mock_data_error": "Error generating data",
+        "mock_data_json": "Generated JSON",
+        "mock_data_export": "Export JSON",
+        "mock_data_history": "Generated data history",
+        "ai_assistant_title": "AI Assistant",
+        "ai_assistant_prompt": "You can ask about the latest JSON",
+        "response_label": "Response",
+        "error_label": "Error",
+        "question_placeholder": "Enter your question for AI here...",
+        "show_full_json": "Show full JSON",
+        "history_date_col": "Date",
+        "history_size_col": "Characters",
+        "history_select_hint": "Select a row to view its JSON"
+    },
+}
+
+_DONATE_HTML = """
+<center>
+<a href="https://www.paypal.com/donate/?hosted_button_id=U48Q33LRS5B9J" target="_blank">
+    <img src="https://www.paypalobjects.com/en_US/i/btn/btn_donate_LG.gif" alt="Donate with PayPal" />
+</a>
+<p>{donate}</p>
+</center>
+"""
+
+# Ejemplo de estructura para la generación de datos dummy, ya serializado
+MOCK_DATA_EXAMPLE = dumps_json(
+    {
+        "id": "objectId",
+        "name": "string",
+        "email": "email",
+        "age": "integer",
+        "score": "number",
+        "active": "boolean",
+        "created": "date",
+        "tags": "array<string>",
+        "profile": {
+            "phone": "phone",
+            "website": "url"
+        }
+    },
+    indent=True,
+)
+
+# HTML del botón de donación ya formateado para cada idioma
+DONATE_HTML = {lang: _DONATE_HTML.format(donate=texts["donate"]) for lang, texts in TEXTS.items()}
+
 
 class JSONInspectorUI:
     """Main class for the JSON Inspector user interface.
@@ -67,149 +490,33 @@ class JSONInspectorUI:
     3. Comparison: For comparing two JSONs and viewing their differences
     """
 
+    # Textos e idiomas compartidos por todas las instancias
+    texts = TEXTS
+    languages = tuple(TEXTS)
+
     def __init__(self):
         """Inicializar la aplicación."""
         self.setup_i18n()
         self.initialize_session_state()
         self.render_header()
 
-    def render_header(self):
-        """Renderizar el encabezado de la aplicación."""
-        st.title(self.t["title"])
-        st.markdown(
-            '''
-            <style>
-                .stButton button {
-                    background-color: #4CAF50;
-                    color: white;
-                    border-radius: 5px;
-                }
-            </style>
-            ''',
-            unsafe_allow_html=True,
-        )
-
     def setup_i18n(self):
         """Configurar internacionalización."""
-        self.lang = st.sidebar.selectbox("Idioma / Language", ["Español", "English"])
-        self.texts = {
-            "Español": {
-                "mock_data_input": "Estructura JSON para generar datos",
-                "mock_data_records": "Cantidad de registros",
-                "generate_mock_btn": "Generar datos",
-                "title": "JSON AI Inspector",
-                "json_input": "Ingresa tu JSON",
-                "format_btn": "Formatear JSON",
-                "export_csv_btn": "Exportar a CSV",
-                "csv_success": "JSON exportado a CSV correctamente",
-                "csv_error": "Error al exportar a CSV",
-                "generate_types_btn": "Generar Tipos",
-                "types_title": "Tipos Generados",
-                "python_tab": "Python",
-                "typescript_tab": "TypeScript",
-                "golang_tab": "Golang",
-                "types_error": "Error al generar tipos",
-                "base_name_label": "Nombre base para los tipos",
-                "question_label": "Pregunta sobre el JSON",
-                "ask_btn": "Preguntar a la IA",
-                "no_api_key": "No se ha configurado la API key de Groq",
-                "invalid_json": "JSON inválido",
-                "json_formatted": "JSON formateado correctamente",
-                "json_saved": "JSON guardado en el historial",
-                "history_title": "Historial de JSON",
-                "history_empty": "No hay JSON en el historial",
-                "json_equal": "Los JSON son iguales",
-                "json_different": "Los JSON son diferentes",
-                "compare_title": "Comparar JSON",
-                "json_input1": "JSON 1",
-                "json_input2": "JSON 2",
-                "compare_btn": "Comparar",
-                "identical_jsons": "Los JSON son idénticos",
-                "different_jsons": "Los JSON son diferentes",
-                "donate": "Apoya el proyecto 💖",
-                "limit_msg": "Has alcanzado el límite gratuito de preguntas IA.",
-                "invalid_question": "❌ La pregunta no parece estar relacionada con el JSON. Reformúlala.",
-                "mock_data_title": "Mock Data Generator",
-                "mock_data_description": "Generate mock data based on JSON structure",
-                "mock_data_example_title": "Example Structure",
-                "mock_data_example_description": "Define data types using a JSON structure. Supported types: string, integer, number, boolean, date, email, phone, url, objectId, array<type>",
-                "mock_data_input": "JSON structure for generating data",
-                "mock_data_btn": "Generate Data",
-                "mock_data_records": "Number of records",
-                "mock_data_success": "Data generated successfully",
-                "mock_data_error": "Error generating data",
-                "mock_data_export": "Export JSON",
-                "mock_data_history": "Data History",
-                "mock_data_help": "Help",
-                "mock_data_help_text": "Use this generator to create mock data based on a JSON structure. Define data types using a simple JSON structure.",
-                "ai_assistant_title": "Asistente de IA",
-                "ai_assistant_prompt": "Puedes preguntar sobre el JSON más reciente",
-                "response_label": "Respuesta",
-                "error_label": "Error",
-                "question_placeholder": "Escribe tu pregunta para AI aquí..."
-            },
-            "English": {
-                "mock_data_input": "Enter the JSON structure",
-                "mock_data_records": "Number of records",
-                "generate_mock_btn": "Generate Data",
-                "title": "JSON AI Inspector",
-                "json_input": "Enter your JSON",
-                "format_btn": "Format JSON",
-                "export_csv_btn": "Export to CSV",
-                "csv_success": "JSON exported to CSV successfully",
-                "csv_error": "Error exporting to CSV",
-                "question_label": "Question about the JSON",
-                "ask_btn": "Ask AI",
-                "no_api_key": "Groq API key not configured",
-                "invalid_json": "Invalid JSON",
-                "json_formatted": "JSON formatted successfully",
-                "json_saved": "JSON saved to history",
-                "history_title": "JSON History",
-                "history_empty": "No JSON in history",
-                "json_equal": "The JSONs are equal",
-                "json_different": "The JSONs are different",
-                "compare_title": "Compare JSON",
-                "json_input1": "JSON 1",
-                "json_input2": "JSON 2",
-                "compare_btn": "Compare",
-                "identical_jsons": "The JSONs are identical",
-                "different_jsons": "The JSONs are different",
-                "donate": "Support the project 💖",
-                "limit_msg": "You have reached the free usage limit for AI questions.",
-                "invalid_question": "❌ The question doesn't seem to be related to JSON. Please rephrase it.",
-                "generate_types_btn": "Generate Types",
-                "types_title": "Generated Types",
-                "python_tab": "Python",
-                "typescript_tab": "TypeScript",
-                "golang_tab": "Golang",
-                "types_error": "Error generating types",
-                "base_name_label": "Base name for types",
-                "mock_data_title": "3. Data Generation",
-                "mock_data_description": "Generate dummy data based on JSON structure.",
-                "mock_data_input": "Enter the JSON structure",
-                "mock_data_example_title": "Example Structure",
-                "mock_data_example_description": "You can use this structure as a base and modify it according to your needs. Supported types are: string, integer, number, boolean, date, email, phone, url, objectId and array<type>.",
-                "num_records_label": "Number of records (max. 1000)",
-                "mock_data_records": "Number of records",
-                "mock_data_btn": "Generate Data",
-                "mock_data_success": "Data generated successfully",
-                "mock_data_error": "Error generating data",
-                "mock_data_json": "Generated JSON",
-                "mock_data_export": "Export JSON",
-                "mock_data_history": "Generated data history",
-                "ai_assistant_title": "AI Assistant",
-                "ai_assistant_prompt": "You can ask about the latest JSON",
-                "response_label": "Response",
-                "error_label": "Error",
-                "question_placeholder": "Enter your question for AI here..."
-            },
-        }
-        self.t = self.texts[self.lang]
+        self.set_language(st.sidebar.selectbox("Idioma / Language", self.languages))
+
+    def set_language(self, lang: str):
+        """Cambiar el idioma de los textos de la interfaz.
+
+        Args:
+            lang: Idioma, una de las claves de TEXTS
+        """
+        self.lang = lang
+        self.t = self.texts[lang]
 
     def initialize_session_state(self):
         """Inicializar estado de la sesión."""
         if "json_history" not in st.session_state:
-            st.session_state["json_history"] = []
+            st.session_state["json_history"] = deque(maxlen=HISTORY_MAX_SIZE)
         if "ia_uses" not in st.session_state:
             st.session_state["ia_uses"] = 0
         if "mock_data_history" not in st.session_state:
@@ -218,17 +525,7 @@ class JSONInspectorUI:
     def render_header(self):
         """Renderizar el encabezado y botón de donación."""
         st.title(self.t["title"])
-        st.markdown(
-            f"""
-            <center>
-            <a href="https://www.paypal.com/donate/?hosted_button_id=U48Q33LRS5B9J" target="_blank">
-                <img src="https://www.paypalobjects.com/en_US/i/btn/btn_donate_LG.gif" alt="Donate with PayPal" />
-            </a>
-            <p>{self.t['donate']}</p>
-            </center>
-            """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(DONATE_HTML[self.lang], unsafe_allow_html=True)
 
     def format_section(self):
         """Sección para formatear JSON."""
@@ -237,16 +534,22 @@ class JSONInspectorUI:
         if "pending_load_json" in st.session_state:
             st.session_state["format_json_input"] = st.session_state["pending_load_json"]
             del st.session_state["pending_load_json"]
-            st.experimental_rerun()
+            st.rerun()
         json_input = st.text_area(self.t["json_input"], key="format_json_input")
 
         if st.button(self.t["format_btn"], key="format_btn"):
-            success, result, data = format_json(json_input)
+            success, result, _ = cached_format_json(json_input)
             if success:
                 st.code(result, language="json")
                 st.success(self.t["json_formatted"])
+                # Identificador estable de la entrada, independiente de su
+                # posición. Solo se guarda el texto formateado: guardar también
+                # el objeto parseado duplicaría la memoria de cada entrada, y
+                # se vuelve a parsear al preguntar a la IA
+                entry_id = st.session_state.get("json_history_seq", 0) + 1
+                st.session_state["json_history_seq"] = entry_id
                 st.session_state["json_history"].append(
-                    {"timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "json": data}
+                    {"id": entry_id, "ts": time.time(), "formatted": result}
                 )
                 st.success(self.t["json_saved"])
             else:
@@ -265,6 +568,26 @@ class JSONInspectorUI:
         Raises:
             ValueError: Si no se ha configurado la API key
         """
+        return "".join(self.ask_ai_stream(question, json_data))
+
+    def ask_ai_stream(self, question: str, json_data: dict) -> Iterator[str]:
+        """Hacer una pregunta a la IA y devolver la respuesta a medida que llega.
+
+        Las respuestas se guardan en una caché LRU compartida entre ejecuciones,
+        indexada por la API key, la pregunta y la huella del JSON; repetir una
+        pregunta no vuelve a llamar a Groq ni cuenta como un uso de la IA.
+
+        Args:
+            question: Pregunta del usuario
+            json_data: Datos JSON a analizar
+
+        Yields:
+            str: Fragmentos de la respuesta de la IA
+
+        Raises:
+            ValueError: Si no se ha configurado la API key o se superó el
+                límite de peticiones por minuto
+        """
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
             try:
@@ -275,30 +598,48 @@ class JSONInspectorUI:
         if not api_key:
             raise ValueError("No se ha configurado la API key de Groq")
 
-        prompt = f"Eres un analista JSON. Dado el siguiente JSON contesta SOLO lo relacionado a su estructura o contenido:\n\n{json_data}\n\nPregunta: {question}\n\nRespuesta concisa y específica sobre el JSON:"
-
-        res = requests.post(
-            "https://api.groq.com/openai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": "llama-3.3-70b-versatile",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "Eres un experto analista de datos JSON. No respondas nada que no esté relacionado directamente con el JSON."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.3
-            }
+        cache_key = ai_cache_key(api_key, question, json_data)
+        cached = get_cached_answer(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        # Limitar la tasa antes de llamar a Groq para no provocar respuestas 429
+        if not get_rate_limiter().try_acquire():
+            raise ValueError(self.t["rate_limit_msg"])
+
+        prompt = f"Eres un analista JSON. Dado el siguiente JSON contesta SOLO lo relacionado a su estructura o contenido:\n\n{dumps_json(json_data)}\n\nPregunta: {question}\n\nRespuesta concisa y específica sobre el JSON:"
+
+        res = get_session().post(
+            GROQ_API_URL,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=(3.05, 30),
+            stream=True,
+            data=orjson.dumps({
+                **_PAYLOAD_TEMPLATE,
+                "messages": [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            }),
         )
-        return res.json().get("choices", [{}])[0].get("message", {}).get("content", "Sin respuesta")
-
+        # Cerrar la respuesta también si falla o si se abandona el generador
+        with res:
+            res.raise_for_status()
+            chunks = []
+            for content in iter_stream_content(res):
+                chunks.append(content)
+                yield content
+        if not chunks:
+            yield "Sin respuesta"
+            return
+
+        st.session_state["ia_uses"] = st.session_state.get("ia_uses", 0) + 1
+        store_answer(cache_key, "".join(chunks))
+
+    @st.fragment
     def compare_section(self):
-        """Sección para comparar dos JSONs."""
+        """Sección para comparar dos JSONs.
+
+        Es un fragmento: sus botones solo vuelven a ejecutar esta sección.
+        """
         st.header(self.t["compare_title"])
         col1, col2 = st.columns(2)
 
@@ -306,18 +647,25 @@ class JSONInspectorUI:
         json2 = col2.text_area(self.t["json_input2"])
 
         if st.button(self.t["compare_btn"]):
-            success, error_msg, result = compare_json(json1, json2)
+            success, error_msg, result = cached_compare_json(json1, json2, COMPARE_MAX_DIFFS)
             if success:
-                if not result["differences"]:
+                differences = result["differences"]
+                if not differences:
                     st.success(self.t["identical_jsons"])
                 else:
                     st.error(self.t["different_jsons"])
-                    st.json(result["differences"])
+                    if len(differences) >= COMPARE_MAX_DIFFS:
+                        st.info(self.t["diff_limit_msg"].format(count=COMPARE_MAX_DIFFS))
+                    st.json(differences)
             else:
                 st.error(error_msg)
 
+    @st.fragment
     def mock_data_section(self):
-        """Sección para generar datos dummy."""
+        """Sección para generar datos dummy.
+
+        Es un fragmento: sus botones solo vuelven a ejecutar esta sección.
+        """
         st.header(self.t["mock_data_title"])
         st.write(self.t["mock_data_description"])
 
@@ -325,26 +673,10 @@ class JSONInspectorUI:
         if "mock_data_history" not in st.session_state:
             st.session_state["mock_data_history"] = []
 
-        # Ejemplo de estructura JSON
-        example_json = {
-            "id": "objectId",
-            "name": "string",
-            "email": "email",
-            "age": "integer",
-            "score": "number",
-            "active": "boolean",
-            "created": "date",
-            "tags": "array<string>",
-            "profile": {
-                "phone": "phone",
-                "website": "url"
-            }
-        }
-
         # Mostrar ejemplo y explicación
         with st.expander("📝 " + self.t["mock_data_example_title"]):
             st.write(self.t["mock_data_example_description"])
-            st.code(json.dumps(example_json, indent=2), language="json")
+            st.code(MOCK_DATA_EXAMPLE, language="json")
 
         # Input para el JSON y número de registros
         json_input = st.text_area(self.t["mock_data_input"], key="mock_data_input")
@@ -363,15 +695,19 @@ class JSONInspectorUI:
                 # Mostrar datos generados y guardar en historial
                 st.success(self.t["mock_data_success"])
                 st.json(records)
+                # Serializar una sola vez: el historial reutiliza el texto en cada ejecución
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                json_pretty = dumps_json(records, indent=True)
                 st.session_state["mock_data_history"].append({
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "json": records
+                    "timestamp": timestamp,
+                    "json": records,
+                    "json_pretty": json_pretty,
                 })
                 # Botón de exportación
                 st.download_button(
                     label=self.t["mock_data_export"],
-                    data=json.dumps(records, indent=2),
-                    file_name=f"mock_data_{datetime.now().strftime('%Y-%m-%d_%H:%M:%S')}.json",
+                    data=json_pretty,
+                    file_name=f"mock_data_{timestamp.replace(' ', '_')}.json",
                     mime="application/json",
                 )
             else:
@@ -381,21 +717,36 @@ class JSONInspectorUI:
             st.subheader(self.t["mock_data_history"])
             for item in st.session_state["mock_data_history"]:
                 with st.expander(f"📅 {item['timestamp']}"):
-                    st.code(json.dumps(item['json'], indent=2), language="json")
+                    st.code(item["json_pretty"], language="json")
                     st.download_button(
                         label=self.t["mock_data_export"],
-                        data=json.dumps(item['json'], indent=2),
+                        data=item["json_pretty"],
                         file_name=f"mock_data_{item['timestamp'].replace(' ', '_')}.json",
                         mime="application/json",
                     )
 
+    def render_json_preview(self, item: dict, key: str):
+        """Mostrar el JSON formateado de una entrada del historial, truncando los muy grandes.
+
+        Args:
+            item: Entrada del historial con el JSON serializado en "formatted"
+            key: Sufijo único para la clave del widget
+        """
+        formatted = item["formatted"]
+        if len(formatted) <= JSON_PREVIEW_LIMIT:
+            st.code(formatted, language="json")
+        elif st.checkbox(self.t["show_full_json"], key=f"show_full_{key}"):
+            st.code(formatted, language="json")
+        else:
+            st.code(history_preview(item), language="json")
+
     def render_history(self):
         """Renderizar historial de JSON."""
         col1, col2, col3 = st.columns(3)
         json_input = st.session_state.get("format_json_input", "")
 
         if col2.button(self.t["export_csv_btn"], key="export_csv_btn"):
-            success, error_msg, csv_data = json_to_csv(json_input)
+            success, error_msg, csv_data = cached_json_to_csv(json_input)
             if success:
                 st.download_button(
                     label="📥 Descargar CSV",
@@ -409,7 +760,7 @@ class JSONInspectorUI:
 
         if col3.button(self.t["generate_types_btn"], key="generate_types_btn"):
             base_name = st.text_input(self.t["base_name_label"], value="Root", key="base_name_input")
-            success, error_msg, types = generate_types(json_input, base_name)
+            success, error_msg, types = cached_generate_types(json_input, base_name)
             if success:
                 st.header(self.t["types_title"])
                 tabs = st.tabs([self.t["python_tab"], self.t["typescript_tab"], self.t["golang_tab"]])
@@ -436,21 +787,44 @@ class JSONInspectorUI:
             if st.session_state.get("show_ai_expander", False):
                 with st.sidebar.expander(self.t["ai_assistant_title"], expanded=True):
                     st.markdown(f"<small>{self.t['ai_assistant_prompt']}</small>", unsafe_allow_html=True)
-                    latest_json = json_history[-1]["json"]
                     ai_question = st.text_input(self.t["question_label"], key="ai_sidebar_question", placeholder=self.t["question_placeholder"])
-                    st.code(json.dumps(latest_json, indent=2), language="json")
+                    self.render_json_preview(json_history[-1], "ai_latest")
                     if st.button(self.t["ask_btn"], key="ai_sidebar_ask_btn"):
                         try:
-                            response = self.ask_ai(ai_question, latest_json)
-                            st.markdown(f"**{self.t['response_label']}:** {response}")
+                            st.markdown(f"**{self.t['response_label']}:**")
+                            latest_json = loads_json(json_history[-1]["formatted"])
+                            st.write_stream(self.ask_ai_stream(ai_question, latest_json))
                         except Exception as e:
                             st.error(f"{self.t['error_label']}: {e}")
-            for idx, item in enumerate(reversed(json_history)):
-                with st.sidebar.expander(f"📅 {item['timestamp']}"):
-                    st.code(json.dumps(item['json'], indent=2), language="json")
-                    if st.button("Cargar en editor", key=f"load_json_{idx}"):
-                        st.session_state["pending_load_json"] = json.dumps(item['json'], indent=2)
-                        st.experimental_rerun()
+            # Una sola tabla con selección en lugar de un expander por entrada;
+            # solo se muestra el JSON de la fila seleccionada
+            entries = list(reversed(json_history))
+            # La selección se guarda por posición: al agregar una entrada (o
+            # descartar la más antigua) las posiciones cambian, así que la
+            # clave incluye el id de la entrada más reciente y la tabla nueva
+            # empieza sin selección en lugar de apuntar a otra entrada
+            table = {
+                self.t["history_date_col"]: [history_timestamp(item) for item in entries],
+                self.t["history_size_col"]: [len(item["formatted"]) for item in entries],
+            }
+            event = st.sidebar.dataframe(
+                table,
+                key=f"history_table_{entries[0]['id']}",
+                on_select="rerun",
+                selection_mode="single-row",
+                hide_index=True,
+                use_container_width=True,
+            )
+            selected_rows = event.selection.rows
+            if not selected_rows or selected_rows[0] >= len(entries):
+                st.sidebar.caption(self.t["history_select_hint"])
+            else:
+                item = entries[selected_rows[0]]
+                with st.sidebar:
+                    self.render_json_preview(item, "history_selected")
+                    if st.button("Cargar en editor", key="load_json_selected"):
+                        st.session_state["pending_load_json"] = item["formatted"]
+                        st.rerun()
 
     def run(self):
         """Ejecutar la aplicación."""
@@ -18,79 +18,264 @@ Example:
     }
 """
 
+import copy
+import csv
 import json
-from deepdiff import DeepDiff
+import os
+import orjson
 import re
+import xxhash
 import random
 import string
+import sys
+import threading
 import uuid
+from collections import OrderedDict
+from functools import lru_cache, partial
+from itertools import islice
 from datetime import datetime, timedelta
-from typing import Dict, Any, Tuple, List, Optional, Union, Tuple
-import pandas as pd
+from typing import Callable, Dict, Any, Iterator, Tuple, List, Optional, Union, Tuple
+import numpy as np
 from io import StringIO
 
+# Palabras clave que indican que una pregunta trata sobre el JSON
+JSON_KEYWORDS = (
+    "json", "campo", "clave", "valor",
+    "estructura", "propiedad", "elemento", "objeto"
+)
+_JSON_KEYWORDS_RE = re.compile("|".join(map(re.escape, JSON_KEYWORDS)), re.IGNORECASE)
+
+# Patrones para reconocer strings con formato, compilados una sola vez
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+_OBJECTID_RE = re.compile(r'^[a-fA-F0-9]{24}$')
+_UUID_RE = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+_PHONE_RE = re.compile(r'^\+?\d{1,4}[-.\s]?\(?\d{1,}\)?[-.\s]?\d{1,}[-.\s]?\d{1,}$')
+
+# Patrones más estrictos usados al inferir el tipo de un campo a partir de sus valores de ejemplo
+_SAMPLE_EMAIL_RE = re.compile(r'^[\w\.-]+@[\w\.-]+\.[\w]{2,}$')
+_SAMPLE_PHONE_RE = re.compile(r'^\+?[1-9][0-9]{7,14}$')
+_SAMPLE_URL_RE = re.compile(r'^https?://[\w\.-]+\.[\w]{2,}[\w\.-/_]*$')
+
+
+def _infer_string_type(value: str) -> str:
+    """Inferir el formato de un string (fecha, ObjectId, UUID, email, teléfono o URL).
+
+    Args:
+        value: String a analizar
+
+    Returns:
+        str: Nombre del tipo inferido
+    """
+    # Detectar patrones comunes. Antes de cada regex se comprueba la
+    # longitud o el primer carácter, que son condiciones necesarias del
+    # patrón, para no ejecutarla con strings que no pueden coincidir
+    # ("$" también acepta un salto de línea final, de ahí el +1).
+    length = len(value)
+    if length >= 10 and value[4] == "-" and value[7] == "-" and _DATE_RE.match(value):  # Fecha
+        return "date"
+    elif (length == 24 or length == 25) and _OBJECTID_RE.match(value):  # ObjectId
+        return "objectId"
+    elif (length == 36 or length == 37) and value[8] == "-" and _UUID_RE.match(value):  # UUID
+        return "uuid"
+    elif '@' in value:  # Email
+        return "email"
+    elif (value[:1] == "+" or value[:1].isdigit()) and _PHONE_RE.match(value):  # Teléfono
+        return "phone"
+    elif value.startswith(("http://", "https://")):  # URL
+        return "url"
+    else:
+        return "string"
+
+
+# Nombres "array<tipo>" de los tipos conocidos, creados una sola vez para no
+# formatear un string nuevo por cada array analizado
+_ARRAY_TYPES = {
+    item_type: sys.intern(f"array<{item_type}>")
+    for item_type in ("string", "integer", "number", "boolean", "null", "date", "objectId",
+                      "uuid", "email", "phone", "url", "object", "any", "array")
+}
+
+
+def _array_type(item_type: str) -> str:
+    """Devolver el nombre interno "array<tipo>" para el tipo de sus elementos.
+
+    Args:
+        item_type: Tipo de los elementos del array
+
+    Returns:
+        str: Nombre del tipo del array
+    """
+    array_type = _ARRAY_TYPES.get(item_type)
+    if array_type is None:
+        # Arrays anidados, p. ej. "array<array<integer>>"
+        array_type = sys.intern(f"array<{item_type}>")
+    return array_type
+
+
+def _infer_list_type(value: List[Any]) -> str:
+    """Inferir el tipo de un array a partir de su primer elemento no nulo.
+
+    Args:
+        value: Lista a analizar
+
+    Returns:
+        str: "array<tipo>" o "array" si no hay elementos no nulos
+    """
+    for item in value:
+        if item is not None:
+            return _array_type(infer_type(item))
+    return "array"
+
+
+# Función que infiere el tipo para cada tipo de Python que produce un parser
+# JSON. bool va antes que int porque es subclase suya.
+_INFER_TYPE_HANDLERS: Dict[type, Callable[[Any], str]] = {
+    bool: lambda value: "boolean",
+    int: lambda value: "integer",
+    float: lambda value: "number",
+    str: _infer_string_type,
+    list: _infer_list_type,
+    dict: lambda value: "object",
+    type(None): lambda value: "null",
+}
+
 
 def infer_type(value: Any) -> str:
     """Inferir el tipo de un valor JSON.
 
+    El tipo exacto del valor se busca en un diccionario; solo las subclases
+    (por ejemplo, un IntEnum) recorren los tipos con isinstance.
+
     Args:
         value: Valor a analizar
 
     Returns:
         str: Nombre del tipo inferido
     """
-    if isinstance(value, bool):
-        return "boolean"
-    elif isinstance(value, int):
-        return "integer"
-    elif isinstance(value, float):
-        return "number"
-    elif isinstance(value, str):
-        # Detectar patrones comunes
-        if re.match(r'^\d{4}-\d{2}-\d{2}', value):  # Fecha
-            return "date"
-        elif re.match(r'^[a-fA-F0-9]{24}$', value):  # ObjectId
-            return "objectId"
-        elif re.match(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$', value):  # UUID
-            return "uuid"
-        elif '@' in value:  # Email
-            return "email"
-        elif re.match(r'^\+?\d{1,4}[-.\s]?\(?\d{1,}\)?[-.\s]?\d{1,}[-.\s]?\d{1,}$', value):  # Teléfono
-            return "phone"
-        elif re.match(r'^https?://', value):  # URL
-            return "url"
-        else:
-            return "string"
-    elif isinstance(value, list):
-        if not value:
-            return "array"
-        # Inferir tipo del primer elemento no nulo
-        for item in value:
-            if item is not None:
-                return f"array<{infer_type(item)}>"
-        return "array"
-    elif isinstance(value, dict):
-        return "object"
-    elif value is None:
-        return "null"
-    else:
-        return "any"
+    handler = _INFER_TYPE_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value)
+    for value_type, handler in _INFER_TYPE_HANDLERS.items():
+        if isinstance(value, value_type):
+            return handler(value)
+    return "any"
 
 
+@lru_cache(maxsize=256)
 def is_json_related(question: str) -> bool:
     """Check if a question is related to JSON analysis.
 
+    Results are memoized, so re-checking the same question on a rerun is a
+    dictionary lookup.
+
     Args:
         question: The question to analyze
 
     Returns:
         bool: True if the question appears to be JSON-related
     """
-    keywords = [
-        "json", "campo", "clave", "valor",
-        "estructura", "propiedad", "elemento", "objeto"
-    ]
-    return any(word in question.lower() for word in keywords)
+    return _JSON_KEYWORDS_RE.search(question) is not None
+
+
+def fingerprint(value: Any) -> int:
+    """Calcular una huella rápida (no criptográfica) de un texto o valor JSON.
+
+    Sirve para detectar cambios en las entradas sin guardar ni comparar
+    el contenido completo. Los valores que no son texto se serializan con
+    las claves ordenadas, por lo que dos objetos iguales tienen la misma huella.
+
+    Args:
+        value: Texto o valor JSON a procesar
+
+    Returns:
+        int: Hash xxh3_64 del contenido codificado en UTF-8
+    """
+    if isinstance(value, str):
+        return xxhash.xxh3_64_intdigest(value.encode("utf-8"))
+    try:
+        payload = orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        # orjson no admite enteros de más de 64 bits
+        payload = json.dumps(value, sort_keys=True).encode("utf-8")
+    return xxhash.xxh3_64_intdigest(payload)
+
+
+# Secuencia de dígitos que puede no caber en un entero de 64 bits
+_LONG_DIGITS_RE = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES_RE = re.compile(rb"\d{19}")
+
+
+def loads_json(text: Union[str, bytes]) -> Any:
+    """Parsear texto JSON usando orjson.
+
+    Si orjson rechaza el texto se vuelve a intentar con el módulo estándar,
+    que acepta NaN y cuyos mensajes de error indican la línea y columna del
+    problema. Los textos con números de 19 dígitos o más se parsean
+    directamente con el módulo estándar, ya que orjson convierte los enteros
+    de más de 64 bits en float.
+
+    Args:
+        text: Texto JSON a parsear
+
+    Returns:
+        Any: Valor JSON parseado
+
+    Raises:
+        json.JSONDecodeError: Si el texto no es JSON válido
+    """
+    return _loads_json(text)[0]
+
+
+def _loads_json(text: Union[str, bytes]) -> Tuple[Any, bool]:
+    """Parsear texto JSON como `loads_json` indicando qué parser se usó.
+
+    Args:
+        text: Texto JSON a parsear
+
+    Returns:
+        Tuple[Any, bool]: (valor parseado, True si lo parseó orjson)
+
+    Raises:
+        json.JSONDecodeError: Si el texto no es JSON válido
+    """
+    long_digits = _LONG_DIGITS_RE if isinstance(text, str) else _LONG_DIGITS_BYTES_RE
+    if long_digits.search(text):
+        return json.loads(text), False
+    try:
+        return orjson.loads(text), True
+    except orjson.JSONDecodeError:
+        return json.loads(text), False
+
+
+def _parse_json(json_data: Union[str, bytes, Any]) -> Any:
+    """Parsear la entrada si llega como texto; los valores ya parseados se devuelven tal cual.
+
+    Args:
+        json_data: JSON string o valor ya parseado
+
+    Returns:
+        Any: Valor JSON
+    """
+    if isinstance(json_data, (str, bytes)):
+        return loads_json(json_data)
+    return json_data
+
+
+def dumps_json(data: Any, indent: bool = False) -> str:
+    """Serializar un valor JSON a texto usando orjson.
+
+    Args:
+        data: Valor JSON a serializar
+        indent: Si es True, indentar con 2 espacios
+
+    Returns:
+        str: JSON serializado en UTF-8 (sin escapar caracteres no ASCII)
+    """
+    try:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None).decode("utf-8")
+    except TypeError:
+        # orjson no admite enteros de más de 64 bits
+        return json.dumps(data, indent=2 if indent else None, ensure_ascii=False)
 
 
 def format_json(json_str: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
@@ -104,39 +289,245 @@ def format_json(json_str: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
     """
     try:
         # Validar y formatear JSON
-        data = json.loads(json_str)
-        formatted = json.dumps(data, indent=2, ensure_ascii=False)
+        data, parsed_with_orjson = _loads_json(json_str)
+        if parsed_with_orjson:
+            formatted = dumps_json(data, indent=True)
+        else:
+            # Lo que orjson no parsea (NaN, Infinity, enteros de más de 64
+            # bits) tampoco lo serializa bien: NaN se convertiría en null
+            formatted = json.dumps(data, indent=2, ensure_ascii=False)
         return True, formatted, data
     except json.JSONDecodeError as e:
         return False, str(e), None
 
 
-def compare_json(json_a: str, json_b: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+def _escape_pointer(token: Any) -> str:
+    """Escapar un segmento de ruta según JSON Pointer (RFC 6901)."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _same_json(a: Any, b: Any) -> bool:
+    """Comprobar si dos valores JSON son iguales, incluido el tipo de cada valor.
+
+    En Python `1 == 1.0 == True`, pero en JSON son valores distintos. Los
+    contenedores iguales con `==` se comparan serializados con orjson, que
+    distingue `1`, `1.0` y `true`; los que orjson no puede serializar
+    (enteros de más de 64 bits) se recorren comparando el tipo de cada valor.
+
+    Args:
+        a: Primer valor JSON
+        b: Segundo valor JSON
+
+    Returns:
+        bool: True si ambos valores son el mismo JSON
+    """
+    if type(a) is not type(b) or a != b:
+        return False
+    if not isinstance(a, (dict, list)):
+        return True
+    try:
+        option = orjson.OPT_SORT_KEYS
+        return orjson.dumps(a, option=option) == orjson.dumps(b, option=option)
+    except orjson.JSONEncodeError:
+        pass
+    # Como a == b, ambos tienen las mismas claves y longitudes
+    stack = [(a, b)]
+    while stack:
+        a, b = stack.pop()
+        if type(a) is not type(b):
+            return False
+        if isinstance(a, dict):
+            stack.extend((value, b[key]) for key, value in a.items())
+        elif isinstance(a, list):
+            stack.extend(zip(a, b))
+    return True
+
+
+def _iter_diff(json_a: Any, json_b: Any) -> Iterator[Dict[str, Any]]:
+    """Yield the differences between two parsed JSON values as JSON Patch ops.
+
+    The walk uses an explicit stack instead of recursion and skips any subtree
+    that compares equal, so consumers that only need the first difference can
+    stop as soon as one is produced.
+
+    Args:
+        json_a: Valor JSON original
+        json_b: Valor JSON modificado
+
+    Yields:
+        Dict[str, Any]: Operación con las claves op, path y value/old
+    """
+    stack = [("", json_a, json_b)]
+    while stack:
+        path, a, b = stack.pop()
+        if _same_json(a, b):
+            continue
+        if isinstance(a, dict) and isinstance(b, dict):
+            children = []
+            for key, value in a.items():
+                child = f"{path}/{_escape_pointer(key)}"
+                if key not in b:
+                    yield {"op": "remove", "path": child, "old": value}
+                else:
+                    children.append((child, value, b[key]))
+            for key, value in b.items():
+                if key not in a:
+                    yield {"op": "add", "path": f"{path}/{_escape_pointer(key)}", "value": value}
+            # Apilar en orden inverso para recorrer en el orden del documento
+            stack.extend(reversed(children))
+        elif isinstance(a, list) and isinstance(b, list):
+            common = min(len(a), len(b))
+            # Apilar solo las posiciones que difieren: en listas largas casi
+            # iguales se evita construir una ruta por cada elemento igual
+            stack.extend(
+                (f"{path}/{index}", a[index], b[index])
+                for index in reversed(range(common))
+                if not _same_json(a[index], b[index])
+            )
+            for index in range(common, len(b)):
+                yield {"op": "add", "path": f"{path}/{index}", "value": b[index]}
+            # Eliminar de atrás hacia adelante para que el patch sea aplicable
+            for index in range(len(a) - 1, common - 1, -1):
+                yield {"op": "remove", "path": f"{path}/{index}", "old": a[index]}
+        else:
+            yield {"op": "replace", "path": path, "old": a, "value": b}
+
+
+def diff_json(json_a: Any, json_b: Any) -> List[Dict[str, Any]]:
+    """Return every difference between two parsed JSON values.
+
+    Args:
+        json_a: Valor JSON original
+        json_b: Valor JSON modificado
+
+    Returns:
+        List[Dict[str, Any]]: Operaciones estilo JSON Patch (RFC 6902)
+    """
+    return list(_iter_diff(json_a, json_b))
+
+
+def first_diff(json_a: Any, json_b: Any) -> Optional[Dict[str, Any]]:
+    """Return the first difference found between two parsed JSON values.
+
+    Args:
+        json_a: Valor JSON original
+        json_b: Valor JSON modificado
+
+    Returns:
+        Optional[Dict[str, Any]]: Primera operación encontrada o None si son iguales
+    """
+    return next(_iter_diff(json_a, json_b), None)
+
+
+def compare_json(json_a: str, json_b: str, max_diffs: Optional[int] = None) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
     """Compare two JSON strings and return their differences.
 
+    The diff walk stops as soon as `max_diffs` differences have been found,
+    so `max_diffs=1` answers "did anything change?" without walking the rest
+    of the documents.
+
     Args:
         json_a: Primer JSON string
         json_b: Segundo JSON string
+        max_diffs: Cantidad máxima de diferencias a reportar (None para todas)
 
     Returns:
         tuple[bool, str, dict]: (Éxito, mensaje de error, resultado)
     """
-    try:
-        json1 = json.loads(json_a)
-        json2 = json.loads(json_b)
+    if json_a == json_b:
+        # Textos idénticos: basta con validar uno de ellos
+        try:
+            loads_json(json_a)
+        except json.JSONDecodeError:
+            return False, "JSON inválido", {}
+        return True, "", {"differences": None}
 
-        if json1 == json2:
-            return True, "", {"differences": None}
-
-        diff = DeepDiff(json1, json2)
-        return True, "", {"differences": diff.to_dict()}
+    try:
+        # Parsear primero la entrada más corta: si es inválida no se paga el
+        # parseo de la otra. orjson retiene el GIL mientras construye los
+        # objetos, por lo que parsear ambas en hilos no resulta más rápido.
+        if len(json_b) < len(json_a):
+            json2 = loads_json(json_b)
+            json1 = loads_json(json_a)
+        else:
+            json1 = loads_json(json_a)
+            json2 = loads_json(json_b)
     except json.JSONDecodeError:
         return False, "JSON inválido", {}
 
+    # diff_json ya descarta los subárboles iguales empezando por la raíz, así
+    # que no hace falta una comparación previa de los documentos completos
+    if max_diffs is None:
+        differences = diff_json(json1, json2)
+    else:
+        differences = list(islice(_iter_diff(json1, json2), max_diffs))
+    return True, "", {"differences": differences or None}
+
+
+# Tipo equivalente en cada lenguaje para los tipos inferidos
+_PYTHON_TYPES = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "null": "None",
+    "date": "datetime",
+    "objectId": "str",
+    "uuid": "str",
+    "email": "str",
+    "phone": "str",
+    "url": "str",
+    "any": "Any"
+}
+_TYPESCRIPT_TYPES = {
+    "string": "string",
+    "integer": "number",
+    "number": "number",
+    "boolean": "boolean",
+    "null": "null",
+    "date": "Date",
+    "objectId": "string",
+    "uuid": "string",
+    "email": "string",
+    "phone": "string",
+    "url": "string",
+    "any": "any"
+}
+_GOLANG_TYPES = {
+    "string": "string",
+    "integer": "int64",
+    "number": "float64",
+    "boolean": "bool",
+    "null": "interface{}",
+    "date": "time.Time",
+    "objectId": "string",
+    "uuid": "string",
+    "email": "string",
+    "phone": "string",
+    "url": "string",
+    "any": "interface{}"
+}
+
+
+def _array_inner(type_name: str) -> Optional[str]:
+    """Extraer el tipo de los elementos de un "array<tipo>".
+
+    Args:
+        type_name: Nombre del tipo
+
+    Returns:
+        Optional[str]: Tipo de los elementos o None si no es "array<...>"
+    """
+    if type_name.startswith("array<") and type_name.endswith(">"):
+        return type_name[6:-1]
+    return None
+
 
 def generate_python_type(name: str, properties: Dict[str, Any], level: int = 0) -> str:
     """Genera una clase Python a partir de un objeto JSON.
 
+    Las clases de los objetos anidados se emiten antes que la clase que las usa.
+
     Args:
         name: Nombre de la clase
         properties: Propiedades y sus tipos
@@ -145,65 +536,49 @@ def generate_python_type(name: str, properties: Dict[str, Any], level: int = 0)
     Returns:
         str: Código Python con la definición de la clase
     """
-    indent = "    " * level
-    type_mappings = {
-        "string": "str",
-        "integer": "int",
-        "number": "float",
-        "boolean": "bool",
-        "null": "None",
-        "date": "datetime",
-        "objectId": "str",
-        "uuid": "str",
-        "email": "str",
-        "phone": "str",
-        "url": "str",
-        "any": "Any"
-    }
+    definitions: List[str] = []
+    _python_type_defs(name, properties, "    " * level, definitions)
+    return "\n\n".join(definitions)
+
 
+def _python_type_defs(name: str, properties: Dict[str, Any], indent: str, definitions: List[str]) -> None:
+    """Agregar a `definitions` las clases anidadas y después la clase `name`."""
     class_def = [f"{indent}@dataclass"]
     class_def.append(f"{indent}class {name}:")
-    
+
     # Agregar docstring
     class_def.append(f"{indent}    \"\"\"{name} model.\"\"\"")
-    
-    # Agregar imports necesarios
-    imports = set(["from dataclasses import dataclass"])
-    if "Any" in str(properties):
-        imports.add("from typing import Any")
-    if "List" in str(properties) or "array" in str(properties):
-        imports.add("from typing import List")
-    if "datetime" in str(properties):
-        imports.add("from datetime import datetime")
 
     # Procesar propiedades
     for prop_name, prop_type in properties.items():
         if isinstance(prop_type, dict):
-            # Generar clase anidada
-            nested_name = prop_name.title()
-            nested_class = generate_python_type(nested_name, prop_type, level + 1)
-            class_def.insert(-1, "\n" + nested_class)
+            # Generar clase anidada; el prefijo del padre evita que dos objetos
+            # anidados con la misma clave generen clases con el mismo nombre
+            nested_name = f"{name}{prop_name.title()}"
+            _python_type_defs(nested_name, prop_type, indent, definitions)
             class_def.append(f"{indent}    {prop_name}: {nested_name}")
         elif prop_type.startswith("array"):
             # Manejar arrays
-            item_type = prop_type[6:-1]  # Extraer tipo dentro de array<...>
+            item_type = _array_inner(prop_type) or "any"  # Extraer tipo dentro de array<...>
             if item_type == "object":
-                nested_name = f"{prop_name.title()}Item"
+                nested_name = f"{name}{prop_name.title()}Item"
                 class_def.append(f"{indent}    {prop_name}: List[{nested_name}]")
             else:
-                mapped_type = type_mappings.get(item_type, item_type)
+                mapped_type = _PYTHON_TYPES.get(item_type, item_type)
                 class_def.append(f"{indent}    {prop_name}: List[{mapped_type}]")
         else:
             # Tipos básicos
-            mapped_type = type_mappings.get(prop_type, prop_type)
+            mapped_type = _PYTHON_TYPES.get(prop_type, prop_type)
             class_def.append(f"{indent}    {prop_name}: {mapped_type}")
 
-    return "\n".join(class_def)
+    definitions.append("\n".join(class_def))
 
 
 def generate_typescript_type(name: str, properties: Dict[str, Any], level: int = 0) -> str:
     """Genera una interfaz TypeScript a partir de un objeto JSON.
 
+    Las interfaces de los objetos anidados se emiten antes que la interfaz que las usa.
+
     Args:
         name: Nombre de la interfaz
         properties: Propiedades y sus tipos
@@ -212,22 +587,13 @@ def generate_typescript_type(name: str, properties: Dict[str, Any], level: int =
     Returns:
         str: Código TypeScript con la definición de la interfaz
     """
-    indent = "  " * level
-    type_mappings = {
-        "string": "string",
-        "integer": "number",
-        "number": "number",
-        "boolean": "boolean",
-        "null": "null",
-        "date": "Date",
-        "objectId": "string",
-        "uuid": "string",
-        "email": "string",
-        "phone": "string",
-        "url": "string",
-        "any": "any"
-    }
+    definitions: List[str] = []
+    _typescript_type_defs(name, properties, "  " * level, definitions)
+    return "\n\n".join(definitions)
+
 
+def _typescript_type_defs(name: str, properties: Dict[str, Any], indent: str, definitions: List[str]) -> None:
+    """Agregar a `definitions` las interfaces anidadas y después la interfaz `name`."""
     interface_def = [f"{indent}export interface {name} {{"]
 
     # Procesar propiedades
@@ -235,30 +601,31 @@ def generate_typescript_type(name: str, properties: Dict[str, Any], level: int =
         if isinstance(prop_type, dict):
             # Generar interfaz anidada
             nested_name = f"{name}{prop_name.title()}"
-            nested_interface = generate_typescript_type(nested_name, prop_type, level + 1)
-            interface_def.insert(-1, nested_interface + "\n")
+            _typescript_type_defs(nested_name, prop_type, indent, definitions)
             interface_def.append(f"{indent}  {prop_name}: {nested_name};")
         elif prop_type.startswith("array"):
             # Manejar arrays
-            item_type = prop_type[6:-1]  # Extraer tipo dentro de array<...>
+            item_type = _array_inner(prop_type) or "any"  # Extraer tipo dentro de array<...>
             if item_type == "object":
                 nested_name = f"{name}{prop_name.title()}Item"
                 interface_def.append(f"{indent}  {prop_name}: {nested_name}[];")
             else:
-                mapped_type = type_mappings.get(item_type, item_type)
+                mapped_type = _TYPESCRIPT_TYPES.get(item_type, item_type)
                 interface_def.append(f"{indent}  {prop_name}: {mapped_type}[];")
         else:
             # Tipos básicos
-            mapped_type = type_mappings.get(prop_type, prop_type)
+            mapped_type = _TYPESCRIPT_TYPES.get(prop_type, prop_type)
             interface_def.append(f"{indent}  {prop_name}: {mapped_type};")
 
     interface_def.append(indent + "}")
-    return "\n".join(interface_def)
+    definitions.append("\n".join(interface_def))
 
 
 def generate_golang_type(name: str, properties: Dict[str, Any], level: int = 0) -> str:
     """Genera una estructura Go a partir de un objeto JSON.
 
+    Las estructuras de los objetos anidados se emiten antes que la estructura que las usa.
+
     Args:
         name: Nombre de la estructura
         properties: Propiedades y sus tipos
@@ -267,24 +634,14 @@ def generate_golang_type(name: str, properties: Dict[str, Any], level: int = 0)
     Returns:
         str: Código Go con la definición de la estructura
     """
-    indent = "\t" * level
-    type_mappings = {
-        "string": "string",
-        "integer": "int64",
-        "number": "float64",
-        "boolean": "bool",
-        "null": "interface{}",
-        "date": "time.Time",
-        "objectId": "string",
-        "uuid": "string",
-        "email": "string",
-        "phone": "string",
-        "url": "string",
-        "any": "interface{}"
-    }
+    definitions = ["// Package models contiene las estructuras de datos\npackage models"] if level == 0 else []
+    _golang_type_defs(name, properties, "\t" * level, definitions)
+    return "\n\n".join(definitions)
 
-    struct_def = ["// Package models contiene las estructuras de datos\npackage models\n"] if level == 0 else []
-    struct_def.append(f"{indent}// {name} representa {name.lower()}")
+
+def _golang_type_defs(name: str, properties: Dict[str, Any], indent: str, definitions: List[str]) -> None:
+    """Agregar a `definitions` las estructuras anidadas y después la estructura `name`."""
+    struct_def = [f"{indent}// {name} representa {name.lower()}"]
     struct_def.append(f"{indent}type {name} struct {{")
 
     # Procesar propiedades
@@ -293,30 +650,44 @@ def generate_golang_type(name: str, properties: Dict[str, Any], level: int = 0)
         if isinstance(prop_type, dict):
             # Generar estructura anidada
             nested_name = f"{name}{prop_name.title()}"
-            nested_struct = generate_golang_type(nested_name, prop_type, level + 1)
-            struct_def.insert(-1, nested_struct + "\n")
+            _golang_type_defs(nested_name, prop_type, indent, definitions)
             struct_def.append(f"{indent}\t{prop_name.title()} {nested_name} {json_tag}")
         elif prop_type.startswith("array"):
             # Manejar arrays
-            item_type = prop_type[6:-1]  # Extraer tipo dentro de array<...>
+            item_type = _array_inner(prop_type) or "any"  # Extraer tipo dentro de array<...>
             if item_type == "object":
                 nested_name = f"{name}{prop_name.title()}Item"
                 struct_def.append(f"{indent}\t{prop_name.title()} []{nested_name} {json_tag}")
             else:
-                mapped_type = type_mappings.get(item_type, item_type)
+                mapped_type = _GOLANG_TYPES.get(item_type, item_type)
                 struct_def.append(f"{indent}\t{prop_name.title()} []{mapped_type} {json_tag}")
         else:
             # Tipos básicos
-            mapped_type = type_mappings.get(prop_type, prop_type)
+            mapped_type = _GOLANG_TYPES.get(prop_type, prop_type)
             struct_def.append(f"{indent}\t{prop_name.title()} {mapped_type} {json_tag}")
 
     struct_def.append(indent + "}")
-    return "\n".join(struct_def)
+    definitions.append("\n".join(struct_def))
+
+
+# Caché LRU de estructuras analizadas, indexada por el hash del texto de entrada
+_STRUCTURE_CACHE: "OrderedDict[int, Any]" = OrderedDict()
+_STRUCTURE_CACHE_SIZE = 64
+_STRUCTURE_CACHE_LOCK = threading.Lock()
 
 
 def analyze_json_structure(json_data: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
     """Analiza la estructura de un JSON y devuelve un diccionario con los tipos inferidos.
 
+    Cuando la entrada es texto, el resultado se guarda en una caché LRU
+    indexada por el hash xxh3 de 128 bits del texto exacto, así que generar
+    tipos y datos dummy del mismo JSON lo analiza una sola vez. El texto
+    conserva el orden de los campos, y con 128 bits la probabilidad de que
+    dos de las 64 entradas colisionen es despreciable (~2^-116), por lo que
+    no se guarda el texto completo para compararlo. Los diccionarios se
+    analizan directamente: serializarlos para obtener la clave costaría tanto
+    como el análisis. Cada llamada devuelve una copia que se puede modificar.
+
     Args:
         json_data: JSON string o diccionario a analizar
 
@@ -324,98 +695,181 @@ def analyze_json_structure(json_data: Union[str, Dict[str, Any]]) -> Dict[str, A
         Dict[str, Any]: Diccionario con los tipos inferidos
     """
     if isinstance(json_data, str):
-        json_data = json.loads(json_data)
-
-    def infer_field_type(field_name: str, values: List[Any]) -> str:
-        """Infiere el tipo de un campo basado en su nombre y valores de ejemplo."""
-        # Normalizar el nombre del campo
-        field_name = field_name.lower()
-
-        # Tipos basados en el nombre del campo
-        if any(x in field_name for x in ['id', 'uuid', 'guid']):
-            return "objectId"
-        elif any(x in field_name for x in ['email', 'mail']):
-            return "email"
-        elif any(x in field_name for x in ['phone', 'tel', 'mobile', 'cellular']):
-            return "phone"
-        elif any(x in field_name for x in ['url', 'website', 'web', 'link']):
-            return "url"
-        elif any(x in field_name for x in ['date', 'time', 'created', 'updated', 'timestamp']):
-            return "date"
-        elif any(x in field_name for x in ['age', 'count', 'number', 'qty', 'quantity', 'index']):
+        key = xxhash.xxh3_128_intdigest(json_data.encode("utf-8"))
+    elif isinstance(json_data, bytes):
+        key = xxhash.xxh3_128_intdigest(json_data)
+    else:
+        return _analyze_json_structure(json_data)
+
+    with _STRUCTURE_CACHE_LOCK:
+        structure = _STRUCTURE_CACHE.get(key)
+        if structure is not None:
+            _STRUCTURE_CACHE.move_to_end(key)
+
+    if structure is None:
+        structure = _analyze_json_structure(json_data)
+        with _STRUCTURE_CACHE_LOCK:
+            _STRUCTURE_CACHE[key] = structure
+            if len(_STRUCTURE_CACHE) > _STRUCTURE_CACHE_SIZE:
+                _STRUCTURE_CACHE.popitem(last=False)
+
+    return copy.deepcopy(structure)
+
+
+# Tipo que se asigna a un campo según las palabras contenidas en su nombre en
+# minúsculas; se usa el primer grupo que coincida
+_FIELD_NAME_TYPES = (
+    ("objectId", ('id', 'uuid', 'guid')),
+    ("email", ('email', 'mail')),
+    ("phone", ('phone', 'tel', 'mobile', 'cellular')),
+    ("url", ('url', 'website', 'web', 'link')),
+    ("date", ('date', 'time', 'created', 'updated', 'timestamp')),
+    ("integer", ('age', 'count', 'number', 'qty', 'quantity', 'index')),
+    ("number", ('price', 'amount', 'score', 'rating', 'percentage')),
+    ("boolean", ('is_', 'has_', 'active', 'enabled', 'status', 'bool')),
+    ("array<string>", ('tags', 'categories', 'items', 'list')),
+)
+_FIELD_NAME_RES = tuple(
+    (field_type, re.compile("|".join(map(re.escape, keywords))))
+    for field_type, keywords in _FIELD_NAME_TYPES
+)
+
+
+@lru_cache(maxsize=1024)
+def _field_name_type(field_name: str) -> Optional[str]:
+    """Inferir el tipo de un campo solo por su nombre.
+
+    Args:
+        field_name: Nombre del campo
+
+    Returns:
+        Optional[str]: Tipo inferido o None si el nombre no da pistas
+    """
+    field_name = field_name.lower()
+    for field_type, pattern in _FIELD_NAME_RES:
+        if pattern.search(field_name):
+            return field_type
+    return None
+
+
+def _infer_field_type(field_name: str, values: List[Any]) -> str:
+    """Infiere el tipo de un campo basado en su nombre y valores de ejemplo.
+
+    Args:
+        field_name: Nombre del campo
+        values: Valores de ejemplo del campo
+
+    Returns:
+        str: Nombre del tipo inferido
+    """
+    # Tipos basados en el nombre del campo
+    name_type = _field_name_type(field_name)
+    if name_type is not None:
+        return name_type
+
+    # Si no se puede inferir por nombre, intentar inferir por los valores de ejemplo
+    for value in values:
+        if isinstance(value, bool):
+            return "boolean"
+        elif isinstance(value, int):
             return "integer"
-        elif any(x in field_name for x in ['price', 'amount', 'score', 'rating', 'percentage']):
+        elif isinstance(value, float):
             return "number"
-        elif any(x in field_name for x in ['is_', 'has_', 'active', 'enabled', 'status', 'bool']):
-            return "boolean"
-        elif any(x in field_name for x in ['tags', 'categories', 'items', 'list']):
-            return "array<string>"
-
-        # Si no se puede inferir por nombre, intentar inferir por los valores de ejemplo
-        for value in values:
-            if isinstance(value, bool):
-                return "boolean"
-            elif isinstance(value, int):
-                return "integer"
-            elif isinstance(value, float):
-                return "number"
-            elif isinstance(value, str):
-                # Intentar inferir el tipo basado en el formato del string
-                if re.match(r'^[0-9a-fA-F]{24}$', value):
-                    return "objectId"
-                elif re.match(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$', value):
-                    return "uuid"
-                elif re.match(r'^[\w\.-]+@[\w\.-]+\.[\w]{2,}$', value):
-                    return "email"
-                elif re.match(r'^\+?[1-9][0-9]{7,14}$', value):
-                    return "phone"
-                elif re.match(r'^https?://[\w\.-]+\.[\w]{2,}[\w\.-/_]*$', value):
-                    return "url"
-                elif re.match(r'^\d{4}-\d{2}-\d{2}', value):
-                    return "date"
-
-        # Por defecto, retornar string
-        return "string"
+        elif isinstance(value, str):
+            # Intentar inferir el tipo basado en el formato del string
+            if _OBJECTID_RE.match(value):
+                return "objectId"
+            elif _UUID_RE.match(value):
+                return "uuid"
+            elif _SAMPLE_EMAIL_RE.match(value):
+                return "email"
+            elif _SAMPLE_PHONE_RE.match(value):
+                return "phone"
+            elif _SAMPLE_URL_RE.match(value):
+                return "url"
+            elif _DATE_RE.match(value):
+                return "date"
+
+    # Por defecto, retornar string
+    return "string"
+
+
+def _analyze_json_structure(json_data: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Analizar la estructura de un JSON sin usar la caché.
+
+    Los objetos anidados se recorren con una pila explícita en lugar de con
+    recursión, así que la profundidad del JSON no está limitada por el límite
+    de recursión de Python.
 
-    def analyze_value(value: Any) -> Union[str, Dict[str, Any]]:
-        if isinstance(value, dict):
-            # Recolectar todos los valores de ejemplo para cada campo
-            field_values = {}
-            if isinstance(json_data, list):
-                for item in json_data:
-                    if isinstance(item, dict):
-                        for k, v in item.items():
-                            if k not in field_values:
-                                field_values[k] = []
-                            field_values[k].append(v)
-            else:
-                for k, v in value.items():
-                    field_values[k] = [v]
-
-            # Inferir tipos para cada campo
-            return {k: analyze_value(v) if isinstance(v, dict) else 
-                      infer_field_type(k, field_values.get(k, [])) 
-                   for k, v in value.items()}
-        elif isinstance(value, list):
-            if not value:
-                return "array<string>"
-            # Analizar el primer elemento no nulo
-            for item in value:
-                if item is not None:
-                    if isinstance(item, dict):
-                        return f"array<object>"
-                    return f"array<{infer_type(item)}>"
-            return "array<string>"
-        else:
-            return infer_type(value)
+    Args:
+        json_data: JSON string o diccionario a analizar
+
+    Returns:
+        Dict[str, Any]: Diccionario con los tipos inferidos
+    """
+    json_data = _parse_json(json_data)
 
     # Si es una lista, analizar la estructura del primer objeto
+    root = json_data
     if isinstance(json_data, list) and json_data:
         first_item = next((item for item in json_data if isinstance(item, dict)), None)
         if first_item:
-            return analyze_value(first_item)
+            root = first_item
+
+    if not isinstance(root, dict):
+        return _analyze_non_object(root)
+
+    # Valores de ejemplo de cada campo: si la entrada es una lista se reúnen
+    # una sola vez de todos sus objetos y se usan en todos los niveles
+    list_values: Optional[Dict[str, List[Any]]] = None
+    if isinstance(json_data, list):
+        list_values = {}
+        for item in json_data:
+            if isinstance(item, dict):
+                for k, v in item.items():
+                    list_values.setdefault(k, []).append(v)
+
+    structure: Dict[str, Any] = {}
+    stack = [(root, structure)]
+    while stack:
+        value, result = stack.pop()
+        for k, v in value.items():
+            if isinstance(v, dict):
+                # El objeto anidado se rellena al sacarlo de la pila
+                nested: Dict[str, Any] = {}
+                result[k] = nested
+                stack.append((v, nested))
+            elif list_values is not None:
+                result[k] = _infer_field_type(k, list_values.get(k, []))
+            else:
+                result[k] = _infer_field_type(k, [v])
+    return structure
+
 
-    return analyze_value(json_data)
+def _analyze_non_object(value: Any) -> str:
+    """Inferir el tipo de una entrada que no es un objeto (lista o escalar).
+
+    Args:
+        value: Valor a analizar
+
+    Returns:
+        str: Nombre del tipo inferido
+    """
+    if isinstance(value, list):
+        # Analizar el primer elemento no nulo
+        for item in value:
+            if item is not None:
+                if isinstance(item, dict):
+                    return "array<object>"
+                return _array_type(infer_type(item))
+        return "array<string>"
+    return infer_type(value)
+
+
+# Valores de ejemplo para los datos dummy
+_MOCK_WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit")
+_MOCK_DOMAINS = ("example.com", "test.com", "dummy.org", "sample.net")
+_MOCK_URL_PATHS = ("api", "docs", "blog", "users", "products")
 
 
 def generate_dummy_data(value_type: str) -> Any:
@@ -432,8 +886,7 @@ def generate_dummy_data(value_type: str) -> Any:
         num_items = random.randint(1, 5)
         return [generate_dummy_data(inner_type) for _ in range(num_items)]
     elif value_type == "string":
-        words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit"]
-        return " ".join(random.choices(words, k=random.randint(1, 4)))
+        return " ".join(random.choices(_MOCK_WORDS, k=random.randint(1, 4)))
     elif value_type == "integer":
         return random.randint(-1000, 1000)
     elif value_type == "number":
@@ -444,25 +897,43 @@ def generate_dummy_data(value_type: str) -> Any:
         days = random.randint(-1000, 1000)
         return (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
     elif value_type == "objectId":
-        return ''.join(random.choices(string.hexdigits.lower(), k=24))
+        # 12 bytes aleatorios en hexadecimal: 24 caracteres en minúscula
+        return os.urandom(12).hex()
     elif value_type == "uuid":
         return str(uuid.uuid4())
     elif value_type == "email":
-        domains = ["example.com", "test.com", "dummy.org", "sample.net"]
         username = ''.join(random.choices(string.ascii_lowercase, k=random.randint(5, 10)))
-        return f"{username}@{random.choice(domains)}"
+        return f"{username}@{random.choice(_MOCK_DOMAINS)}"
     elif value_type == "phone":
         return f"+{random.randint(1, 99)}{random.randint(100000000, 999999999)}"
     elif value_type == "url":
-        domains = ["example.com", "test.com", "dummy.org", "sample.net"]
-        paths = ["api", "docs", "blog", "users", "products"]
-        return f"https://{random.choice(domains)}/{random.choice(paths)}"
+        return f"https://{random.choice(_MOCK_DOMAINS)}/{random.choice(_MOCK_URL_PATHS)}"
     elif value_type == "null":
         return None
     else:
         return "dummy_value"
 
 
+def _generate_field(value_type: Any) -> Any:
+    """Genera el valor dummy de un campo según su tipo (objeto, array o escalar).
+
+    Args:
+        value_type: Tipo del campo o estructura del objeto anidado
+
+    Returns:
+        Any: Valor generado
+    """
+    if isinstance(value_type, dict):
+        return generate_dummy_object(value_type)
+    elif isinstance(value_type, str) and value_type.startswith("array"):
+        # Generar array con 1-5 elementos
+        item_type = value_type[6:-1]  # Extraer tipo dentro de array<...>
+        if item_type == "object":
+            return [generate_dummy_object({"item": "string"})["item"] for _ in range(random.randint(1, 5))]
+        return [generate_dummy_data(item_type) for _ in range(random.randint(1, 5))]
+    return generate_dummy_data(value_type)
+
+
 def generate_dummy_object(structure: Dict[str, Any]) -> Dict[str, Any]:
     """Genera un objeto dummy basado en la estructura.
 
@@ -472,20 +943,108 @@ def generate_dummy_object(structure: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Objeto dummy generado
     """
-    result = {}
-    for key, value_type in structure.items():
+    return {key: _generate_field(value_type) for key, value_type in structure.items()}
+
+
+def _compile_field(value_type: Any) -> Callable[[], Any]:
+    """Preparar un generador de valores dummy para un campo.
+
+    El tipo se interpreta una sola vez (por ejemplo, se extrae el tipo de los
+    elementos de "array<...>") y la función devuelta solo genera valores.
+
+    Args:
+        value_type: Tipo del campo o estructura del objeto anidado
+
+    Returns:
+        Callable[[], Any]: Función sin argumentos que genera un valor
+    """
+    if isinstance(value_type, dict):
+        return partial(generate_dummy_object, value_type)
+    if isinstance(value_type, str) and value_type.startswith("array"):
+        item_type = value_type[6:-1]  # Extraer tipo dentro de array<...>
+        if item_type == "object":
+            # Igual que en _generate_field: los arrays de objetos se rellenan con strings
+            item_type = "string"
+        return lambda: [generate_dummy_data(item_type) for _ in range(random.randint(1, 5))]
+    return partial(generate_dummy_data, value_type)
+
+
+def _generate_column(value_type: Any, num_records: int, rng: np.random.Generator) -> Optional[List[Any]]:
+    """Genera de una vez todos los valores de un campo.
+
+    Los números aleatorios de la columna se obtienen en una sola llamada a
+    NumPy (o a `os.urandom` para ObjectIds y UUIDs) en lugar de una llamada
+    a `random` por valor.
+
+    Args:
+        value_type: Tipo del campo
+        num_records: Cantidad de valores a generar
+        rng: Generador de números aleatorios de NumPy
+
+    Returns:
+        Optional[List[Any]]: Valores como tipos nativos de Python, o None si
+        el tipo no se genera por columnas
+    """
+    if value_type == "integer":
+        return rng.integers(-1000, 1000, size=num_records, endpoint=True).tolist()
+    if value_type == "number":
+        return np.round(rng.uniform(-1000, 1000, size=num_records), 2).tolist()
+    if value_type == "boolean":
+        return (rng.random(num_records) < 0.5).tolist()
+    if value_type == "string":
+        counts = rng.integers(1, 4, size=num_records, endpoint=True).tolist()
+        indices = rng.integers(0, len(_MOCK_WORDS), size=(num_records, 4)).tolist()
+        return [
+            " ".join([_MOCK_WORDS[index] for index in row[:count]])
+            for row, count in zip(indices, counts)
+        ]
+    if value_type == "date":
+        today = np.datetime64(datetime.now().date(), "D")
+        days = rng.integers(-1000, 1000, size=num_records, endpoint=True)
+        return (today + days).astype(str).tolist()
+    if value_type == "objectId":
+        hex_text = os.urandom(12 * num_records).hex()
+        return [hex_text[start:start + 24] for start in range(0, 24 * num_records, 24)]
+    if value_type == "uuid":
+        raw = os.urandom(16 * num_records)
+        return [
+            str(uuid.UUID(bytes=raw[start:start + 16], version=4))
+            for start in range(0, 16 * num_records, 16)
+        ]
+    return None
+
+
+def _generate_records(structure: Dict[str, Any], num_records: int, rng: np.random.Generator) -> List[Dict[str, Any]]:
+    """Genera varios objetos dummy con la misma estructura.
+
+    Los valores se generan por columnas (un campo para todos los registros a
+    la vez) y los objetos se arman al final en una sola pasada. Los tipos
+    escalares más comunes se generan por lotes con `_generate_column`.
+
+    Args:
+        structure: Estructura de los objetos
+        num_records: Cantidad de objetos a generar
+        rng: Generador de números aleatorios de NumPy
+
+    Returns:
+        List[Dict[str, Any]]: Objetos dummy generados
+    """
+    if not structure:
+        return [{} for _ in range(num_records)]
+
+    columns = []
+    for value_type in structure.values():
         if isinstance(value_type, dict):
-            result[key] = generate_dummy_object(value_type)
-        elif isinstance(value_type, str) and value_type.startswith("array"):
-            # Generar array con 1-5 elementos
-            item_type = value_type[6:-1]  # Extraer tipo dentro de array<...>
-            if item_type == "object":
-                result[key] = [generate_dummy_object({"item": "string"})["item"] for _ in range(random.randint(1, 5))]
-            else:
-                result[key] = [generate_dummy_data(item_type) for _ in range(random.randint(1, 5))]
+            column = _generate_records(value_type, num_records, rng)
         else:
-            result[key] = generate_dummy_data(value_type)
-    return result
+            column = _generate_column(value_type, num_records, rng)
+            if column is None:
+                generate = _compile_field(value_type)
+                column = [generate() for _ in range(num_records)]
+        columns.append(column)
+
+    keys = tuple(structure)
+    return [dict(zip(keys, row)) for row in zip(*columns)]
 
 
 def generate_mock_data(json_data: Union[str, Dict[str, Any]], num_records: int = 10) -> Tuple[bool, str, Optional[List[Dict[str, Any]]]]:
@@ -502,17 +1061,17 @@ def generate_mock_data(json_data: Union[str, Dict[str, Any]], num_records: int =
         return False, "El número de registros no puede ser mayor al máximo permitido (1000)", None
 
     try:
-        if isinstance(json_data, str):
-            json_data = json.loads(json_data)
+        # Analizar estructura: el texto se pasa tal cual para que la caché lo
+        # indexe sin reserializarlo y solo se parsee si no estaba analizado
+        structure = analyze_json_structure(json_data)
     except json.JSONDecodeError:
         return False, "JSON inválido", None
+    except Exception as e:
+        return False, f"Error al generar datos dummy: {str(e)}", None
 
     try:
-        # Analizar estructura
-        structure = analyze_json_structure(json_data)
-
         # Generar registros
-        records = [generate_dummy_object(structure) for _ in range(num_records)]
+        records = _generate_records(structure, num_records, np.random.default_rng())
 
         return True, "", records
     except Exception as e:
@@ -536,10 +1095,9 @@ def generate_types(json_data: Union[str, Dict[str, Any]], base_name: str = "Root
         # Analizar estructura
         structure = analyze_json_structure(json_data)
 
-        # Generar tipos para cada lenguaje
-        python_code = generate_python_type(base_name, structure)
-        typescript_code = generate_typescript_type(base_name, structure)
-        golang_code = generate_golang_type(base_name, structure)
+        # Generar tipos para cada lenguaje; la estructura serializada (que
+        # conserva el orden de los campos) sirve de clave para la caché
+        python_code, typescript_code, golang_code = _generate_types_cached(orjson.dumps(structure), base_name)
 
         return True, "", {
             "python": python_code,
@@ -550,6 +1108,91 @@ def generate_types(json_data: Union[str, Dict[str, Any]], base_name: str = "Root
         return False, f"Error al generar tipos: {str(e)}", {}
 
 
+@lru_cache(maxsize=64)
+def _generate_types_cached(structure_json: bytes, base_name: str) -> Tuple[str, str, str]:
+    """Generar el código Python, TypeScript y Go de una estructura serializada.
+
+    Args:
+        structure_json: Estructura inferida serializada con orjson
+        base_name: Nombre base para las clases/interfaces/estructuras
+
+    Returns:
+        Tuple[str, str, str]: Código Python, TypeScript y Go
+    """
+    structure = orjson.loads(structure_json)
+    return (
+        generate_python_type(base_name, structure),
+        generate_typescript_type(base_name, structure),
+        generate_golang_type(base_name, structure),
+    )
+
+
+# Grupos de columnas del CSV, en el orden en que se muestran. Una columna
+# pertenece al primer grupo con algún campo contenido en su nombre en
+# minúsculas; las que no encajan en ninguno (arrays y resto) van al final.
+_CSV_COLUMN_GROUPS = (
+    # 1. IDs y campos de identificación
+    ('id', 'uuid', 'objectId', 'username', 'email'),
+    # 2. Información personal básica
+    ('name', 'first', 'last', 'middle', 'phone', 'password', 'status', 'message'),
+    # 3. Información de localización
+    ('location', 'address', 'street', 'city', 'state', 'country', 'zip', 'coordinates'),
+    # 4. Información profesional
+    ('job', 'company', 'website', 'domain'),
+    # 5. Información financiera
+    ('creditCard', 'payment', 'bank'),
+)
+_CSV_GROUP_RES = tuple(
+    re.compile("|".join(map(re.escape, fields))) for fields in _CSV_COLUMN_GROUPS
+)
+
+
+def _csv_column_group(column: str) -> int:
+    """Obtener la posición del grupo al que pertenece una columna del CSV.
+
+    Args:
+        column: Nombre de la columna aplanada
+
+    Returns:
+        int: Índice en _CSV_COLUMN_GROUPS, o su longitud si no encaja en ninguno
+    """
+    lowered = column.lower()
+    for index, pattern in enumerate(_CSV_GROUP_RES):
+        if pattern.search(lowered):
+            return index
+    return len(_CSV_GROUP_RES)
+
+
+def _flatten_record(record: Any, prefix: str = "", out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Aplanar un objeto JSON en un diccionario de columnas.
+
+    Los objetos anidados se convierten en claves separadas por puntos
+    ("perfil.telefono"); las listas y los escalares se mantienen como valor.
+
+    Args:
+        record: Objeto JSON a aplanar
+        prefix: Prefijo de las claves del nivel actual
+        out: Diccionario donde se acumulan las columnas
+
+    Returns:
+        Dict[str, Any]: Columnas del registro en orden de aparición
+
+    Raises:
+        TypeError: Si el registro no es un objeto JSON
+    """
+    if not isinstance(record, dict):
+        raise TypeError("Todos los elementos deben ser objetos JSON")
+    if out is None:
+        out = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            _flatten_record(value, f"{name}.", out)
+        else:
+            out[name] = value
+    return out
+
+
 def json_to_csv(json_data: Union[str, Dict[str, Any]]) -> Tuple[bool, str, Optional[str]]:
     """Convert JSON to CSV format with intelligent column ordering and formatting.
 
@@ -564,8 +1207,7 @@ def json_to_csv(json_data: Union[str, Dict[str, Any]]) -> Tuple[bool, str, Optio
     """
     try:
         # Si es string, convertir a diccionario
-        if isinstance(json_data, str):
-            json_data = json.loads(json_data)
+        json_data = _parse_json(json_data)
 
         # Si tenemos un objeto 'result' que contiene un array, usar el contenido del array
         if isinstance(json_data, dict) and 'result' in json_data and isinstance(json_data['result'], list):
@@ -576,61 +1218,20 @@ def json_to_csv(json_data: Union[str, Dict[str, Any]]) -> Tuple[bool, str, Optio
         elif isinstance(json_data, dict):
             json_data = [json_data]
 
-        # Convertir a DataFrame con manejo especial de datos anidados
-        df = pd.json_normalize(
-            json_data,
-            sep='.',  # Usar punto como separador para niveles anidados
-            max_level=None  # No limitar la profundidad de anidamiento
-        )
-
-        # Ordenar columnas de manera inteligente por grupos
-        columns = list(df.columns)
-        ordered_columns = []
-
-        # 1. IDs y campos de identificación
-        id_fields = ['id', 'uuid', 'objectId', 'username', 'email']
-        id_columns = [col for col in columns if any(id_field in col.lower() for id_field in id_fields)]
-        ordered_columns.extend(sorted(id_columns))
-
-        # 2. Información personal básica
-        personal_fields = ['name', 'first', 'last', 'middle', 'phone', 'password', 'status', 'message']
-        personal_columns = [col for col in columns 
-                          if any(field in col.lower() for field in personal_fields)
-                          and col not in ordered_columns]
-        ordered_columns.extend(sorted(personal_columns))
-
-        # 3. Información de localización
-        location_fields = ['location', 'address', 'street', 'city', 'state', 'country', 'zip', 'coordinates']
-        location_columns = [col for col in columns 
-                          if any(field in col.lower() for field in location_fields)
-                          and col not in ordered_columns]
-        ordered_columns.extend(sorted(location_columns))
-
-        # 4. Información profesional
-        job_fields = ['job', 'company', 'website', 'domain']
-        job_columns = [col for col in columns 
-                      if any(field in col.lower() for field in job_fields)
-                      and col not in ordered_columns]
-        ordered_columns.extend(sorted(job_columns))
-
-        # 5. Información financiera
-        financial_fields = ['creditCard', 'payment', 'bank']
-        financial_columns = [col for col in columns 
-                           if any(field in col.lower() for field in financial_fields)
-                           and col not in ordered_columns]
-        ordered_columns.extend(sorted(financial_columns))
-
-        # 6. Arrays y campos restantes
-        remaining_columns = [col for col in columns if col not in ordered_columns]
-        ordered_columns.extend(sorted(remaining_columns))
-
-        # Reordenar el DataFrame
-        df = df[ordered_columns]
+        # Aplanar cada registro: los objetos anidados se convierten en columnas
+        # con el punto como separador y el resto de valores se mantiene
+        rows = [_flatten_record(record) for record in json_data]
+        # Columnas sin repetir
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+
+        # Ordenar columnas de manera inteligente por grupos y, dentro de cada
+        # grupo, alfabéticamente
+        ordered_columns = sorted(columns, key=lambda col: (_csv_column_group(col), col))
 
         # Limpiar nombres de columnas para mejor legibilidad
         clean_columns = []
-        for col in df.columns:
-            # Mantener la notación de array con []  
+        for col in ordered_columns:
+            # Mantener la notación de array con []
             if '[' in col:
                 base_name = col.split('[')[0]
                 array_index = col[col.find('['):]
@@ -638,12 +1239,12 @@ def json_to_csv(json_data: Union[str, Dict[str, Any]]) -> Tuple[bool, str, Optio
             else:
                 clean_name = col.replace('.', ' ').title()
             clean_columns.append(clean_name)
-        
-        df.columns = clean_columns
 
-        # Convertir a CSV
+        # Escribir el CSV fila a fila; los campos ausentes o nulos quedan vacíos
         csv_buffer = StringIO()
-        df.to_csv(csv_buffer, index=False, encoding='utf-8')
+        writer = csv.writer(csv_buffer, lineterminator="\n")
+        writer.writerow(clean_columns)
+        writer.writerows([row.get(col) for col in ordered_columns] for row in rows)
         csv_string = csv_buffer.getvalue()
 
         return True, "", csv_string
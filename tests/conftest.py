@@ -1,8 +1,68 @@
 """Fixtures for JSON AI Inspector tests."""
 
+import functools
+import json
+import sys
+from unittest.mock import MagicMock
+
 import pytest
 
 
+def memoize(func=None, **kwargs):
+    """Stand-in for st.cache_data / st.cache_resource that memoizes in-process."""
+    if func is None:
+        return memoize
+    cached = functools.cache(func)
+    cached.clear = cached.cache_clear
+    return cached
+
+
+# Sustituir streamlit antes de que los tests importen app; los decoradores de
+# caché memorizan como los reales y los fragmentos se ejecutan como métodos
+STREAMLIT_STUB = MagicMock()
+STREAMLIT_STUB.cache_data.side_effect = memoize
+STREAMLIT_STUB.cache_resource.side_effect = memoize
+STREAMLIT_STUB.fragment.side_effect = lambda func=None, **kwargs: func or (lambda f: f)
+sys.modules['streamlit'] = STREAMLIT_STUB
+
+# Estado de sesión compartido; el fixture session_state lo vacía en cada test
+SESSION_STATE = {}
+STREAMLIT_STUB.session_state = SESSION_STATE
+
+
+@pytest.fixture(scope="session")
+def streamlit_stub():
+    """Return the Streamlit stub shared by the whole test session."""
+    return STREAMLIT_STUB
+
+
+@pytest.fixture
+def session_state():
+    """Return the Streamlit session state, emptied for the current test.
+
+    The same dict is installed once on the stub and reused by every test.
+    """
+    SESSION_STATE.clear()
+    return SESSION_STATE
+
+
+@pytest.fixture
+def mock_streamlit(streamlit_stub, session_state):
+    """Reset the Streamlit components used by every UI test.
+
+    Instead of patching each attribute per test, the shared stub's sidebar,
+    title and markdown mocks are reset and the session state is emptied.
+    """
+    for name in ("sidebar", "title", "markdown"):
+        getattr(streamlit_stub, name).reset_mock(return_value=True, side_effect=True)
+    streamlit_stub.sidebar.selectbox.return_value = "Español"
+    return {
+        "sidebar": streamlit_stub.sidebar,
+        "title": streamlit_stub.title,
+        "markdown": streamlit_stub.markdown,
+    }
+
+
 @pytest.fixture
 def valid_json():
     """Return a valid JSON string."""
@@ -31,6 +91,31 @@ def complex_json():
         }
     }'''
 
+@pytest.fixture(scope="session")
+def type_structure():
+    """Return a sample JSON structure with type definitions (shared, do not modify)."""
+    return {
+        "id": "objectId",
+        "name": "string",
+        "email": "email",
+        "age": "integer",
+        "score": "number",
+        "active": "boolean",
+        "created": "date",
+        "tags": "array<string>",
+        "profile": {
+            "phone": "phone",
+            "website": "url"
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def type_structure_json(type_structure):
+    """Return type_structure serialized once as compact JSON text."""
+    return json.dumps(type_structure, separators=(",", ":"))
+
+
 @pytest.fixture
 def json_questions():
     """Return a list of JSON-related questions."""
@@ -42,13 +127,6 @@ def json_questions():
         "¿Cuál es el valor del campo nested.key?"
     ]
 
-@pytest.fixture
-def mock_streamlit():
-    mock = MagicMock()
-    mock.session_state = {}
-    mock.secrets = {}
-    return mock
-
 @pytest.fixture
 def non_json_questions():
     """Return a list of non-JSON-related questions."""
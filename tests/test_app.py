@@ -1,7 +1,15 @@
 """Tests for the JSON AI Inspector core functionality."""
 
+import json
+from enum import IntEnum
+from unittest.mock import patch
+
 import pytest
-from json_inspector import is_json_related, format_json, compare_json
+from json_inspector import (
+    is_json_related, format_json, compare_json, diff_json, first_diff, infer_type, loads_json,
+    json_to_csv, generate_types, generate_python_type, generate_typescript_type,
+    generate_golang_type
+)
 
 
 @pytest.mark.parametrize("question", [
@@ -104,6 +112,13 @@ def test_compare_json_invalid():
     assert result == {}
 
 
+def test_compare_json_identical_invalid():
+    """Test that identical but invalid inputs are still rejected."""
+    success, error_msg, result = compare_json("{invalid", "{invalid")
+    assert not success
+    assert result == {}
+
+
 def test_compare_json_empty():
     """Test comparing with empty input."""
     success, error_msg, result = compare_json("", "")
@@ -116,3 +131,228 @@ def test_compare_json_whitespace(valid_json):
     success, error_msg, result = compare_json(valid_json, "   \n\t   ")
     assert not success
     assert result == {}
+
+
+def test_compare_json_reports_patch_operations(valid_json):
+    """Test that differences are reported as JSON Patch operations."""
+    json_b = '{"name": "test", "value": 456, "nested": {"key": "different"}}'
+    success, error_msg, result = compare_json(valid_json, json_b)
+    assert success
+    assert result["differences"] == [
+        {"op": "replace", "path": "/value", "old": 123, "value": 456},
+        {"op": "replace", "path": "/nested/key", "old": "value", "value": "different"},
+    ]
+
+
+def test_diff_json_added_and_removed_entries():
+    """Test added/removed keys and list items, including pointer escaping."""
+    json_a = {"a/b": 1, "list": [1, 2, 3], "gone": True}
+    json_b = {"a/b": 1, "list": [1, 5], "new~key": None}
+    assert diff_json(json_a, json_b) == [
+        {"op": "remove", "path": "/gone", "old": True},
+        {"op": "add", "path": "/new~0key", "value": None},
+        {"op": "remove", "path": "/list/2", "old": 3},
+        {"op": "replace", "path": "/list/1", "old": 2, "value": 5},
+    ]
+
+
+def test_first_diff():
+    """Test that first_diff stops at the first difference."""
+    assert first_diff({"a": [1, 2]}, {"a": [1, 2]}) is None
+    assert first_diff({"a": 1, "b": 2}, {"a": 0, "b": 0}) == {
+        "op": "replace", "path": "/a", "old": 1, "value": 0
+    }
+
+
+def test_format_json_outside_orjson_range():
+    """Test formatting values orjson rejects, such as integers above 64 bits."""
+    success, formatted, data = format_json('{"big": 123456789012345678901234567890}')
+    assert success
+    assert data["big"] == 123456789012345678901234567890
+    assert "123456789012345678901234567890" in formatted
+
+
+@pytest.mark.parametrize("text", [
+    pytest.param('{"big": 18446744073709551616}', id="str"),
+    pytest.param(b'{"big": 18446744073709551616}', id="bytes"),
+])
+def test_loads_json_keeps_integers_above_64_bits(text):
+    """Test that integers orjson would turn into floats are parsed exactly."""
+    value = loads_json(text)["big"]
+    assert isinstance(value, int)
+    assert value == 18446744073709551616
+
+
+def test_format_json_keeps_non_finite_numbers():
+    """Test that NaN and Infinity survive formatting instead of becoming null."""
+    success, formatted, data = format_json('{"a": NaN, "b": Infinity, "c": -Infinity}')
+    assert success
+    assert '"a": NaN' in formatted
+    assert '"b": Infinity' in formatted
+    assert '"c": -Infinity' in formatted
+    assert "null" not in formatted
+    assert format_json(formatted)[1] == formatted
+
+
+def test_diff_json_long_scalar_list():
+    """Test that only the changed positions of a long list are reported."""
+    before = list(range(10_000))
+    after = list(before)
+    after[3] = -3
+    after[9_999] = -1
+    assert diff_json(before, after) == [
+        {"op": "replace", "path": "/3", "old": 3, "value": -3},
+        {"op": "replace", "path": "/9999", "old": 9_999, "value": -1},
+    ]
+
+
+@pytest.mark.parametrize("json_a, json_b, expected", [
+    pytest.param('{"a": 1}', '{"a": true, "b": 1}', [
+        {"op": "add", "path": "/b", "value": 1},
+        {"op": "replace", "path": "/a", "old": 1, "value": True},
+    ], id="int-to-bool"),
+    pytest.param('[1]', '[true]', [
+        {"op": "replace", "path": "/0", "old": 1, "value": True},
+    ], id="list-int-to-bool"),
+    pytest.param('{"a": 1}', '{"a": 1.0}', [
+        {"op": "replace", "path": "/a", "old": 1, "value": 1.0},
+    ], id="int-to-float"),
+    pytest.param('{"x": {"y": [0, {"z": 1}]}}', '{"x": {"y": [false, {"z": 1.0}]}}', [
+        {"op": "replace", "path": "/x/y/0", "old": 0, "value": False},
+        {"op": "replace", "path": "/x/y/1/z", "old": 1, "value": 1.0},
+    ], id="nested"),
+    pytest.param('{"big": [18446744073709551616, 1]}', '{"big": [18446744073709551616, true]}', [
+        {"op": "replace", "path": "/big/1", "old": 1, "value": True},
+    ], id="outside-orjson-range"),
+])
+def test_compare_json_reports_type_changes(json_a, json_b, expected):
+    """Test that values equal in Python but of different JSON types are reported."""
+    success, _, result = compare_json(json_a, json_b)
+    assert success
+    assert result["differences"] == expected
+    # En Python True == 1, así que también se comprueba el tipo de cada valor
+    assert [type(op.get("value")) for op in result["differences"]] == [
+        type(op.get("value")) for op in expected
+    ]
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024-01-31", "date"),
+    ("2024-01-31T10:00:00Z", "date"),
+    ("5f7b5e9b2d5a7c1234567890", "objectId"),
+    ("5f7b5e9b2d5a7c123456789", "string"),
+    ("123e4567-e89b-12d3-a456-426614174000", "uuid"),
+    ("user@example.com", "email"),
+    ("+1 (555) 123-4567", "phone"),
+    ("https://example.com/a", "url"),
+    ("ftp://example.com", "string"),
+    ("", "string"),
+])
+def test_infer_type_strings(value, expected):
+    """Test string format detection in infer_type."""
+    assert infer_type(value) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    (True, "boolean"),
+    (7, "integer"),
+    (1.5, "number"),
+    (None, "null"),
+    ({}, "object"),
+    ([], "array"),
+    ([None, 3], "array<integer>"),
+    (IntEnum("Level", "LOW").LOW, "integer"),
+    (b"raw", "any"),
+])
+def test_infer_type_non_strings(value, expected):
+    """Test type dispatch for non-string values, including subclasses."""
+    assert infer_type(value) == expected
+
+
+def test_compare_json_max_diffs():
+    """Test that compare_json stops after max_diffs differences."""
+    success, _, result = compare_json('{"a": 1, "b": 2, "c": 3}', '{"a": 0, "b": 0, "c": 0}', max_diffs=1)
+    assert success
+    assert result["differences"] == [{"op": "replace", "path": "/a", "old": 1, "value": 0}]
+
+    _, _, result = compare_json('{"a": 1}', '{"a": 1}', max_diffs=1)
+    assert result["differences"] is None
+
+
+def test_json_to_csv_flattens_and_orders_columns():
+    """Test CSV export of nested records with grouped column ordering."""
+    data = [
+        {"zeta": 1, "profile": {"city": "Lima", "phone": "+51 1"}, "id": "a1", "tags": ["x", "y"]},
+        {"id": "b2", "zeta": 2, "extra": None},
+    ]
+    success, error, csv_text = json_to_csv(json.dumps(data))
+    assert success
+    assert not error
+    assert csv_text.splitlines() == [
+        "Id,Profile Phone,Profile City,Extra,Tags,Zeta",
+        "a1,+51 1,Lima,,\"['x', 'y']\",1",
+        "b2,,,,,2",
+    ]
+
+
+def test_json_to_csv_rejects_non_object_items():
+    """Test that arrays of scalars cannot be exported as CSV."""
+    success, error, csv_text = json_to_csv("[1, 2]")
+    assert not success
+    assert error.startswith("Error al convertir a CSV")
+    assert csv_text is None
+
+
+def test_generate_types_emits_nested_definitions_first():
+    """Test that nested types are declared before the types that use them."""
+    success, error, types = generate_types({"name": "x", "profile": {"geo": {"lat": 1.5}}})
+    assert success
+    assert not error
+    assert types["typescript"] == (
+        "export interface RootProfileGeo {\n  lat: number;\n}\n\n"
+        "export interface RootProfile {\n  geo: RootProfileGeo;\n}\n\n"
+        "export interface Root {\n  name: string;\n  profile: RootProfile;\n}"
+    )
+    python = types["python"]
+    assert python.index("class RootProfileGeo:") < python.index("class RootProfile:") < python.index("class Root:")
+    assert "    geo: RootProfileGeo" in python
+    assert types["golang"].startswith("// Package models contiene las estructuras de datos\npackage models\n\n")
+    assert types["golang"].count("package models") == 1
+
+
+def test_generate_types_distinct_names_for_repeated_nested_keys():
+    """Test that nested objects sharing a key get distinct type names."""
+    success, _, types = generate_types({"a": {"info": {"x": 1}}, "b": {"info": {"y": "z"}}})
+    assert success
+    python = types["python"]
+    assert python.count("class RootAInfo:") == python.count("class RootBInfo:") == 1
+    assert "    info: RootAInfo" in python
+    assert "    info: RootBInfo" in python
+    assert types["typescript"].count("export interface RootAInfo {") == 1
+    assert types["typescript"].count("export interface RootBInfo {") == 1
+    assert types["golang"].count("type RootAInfo struct {") == 1
+    assert types["golang"].count("type RootBInfo struct {") == 1
+
+
+def test_type_generators_distinct_names_for_repeated_array_keys():
+    """Test that arrays of objects sharing a key get the same distinct item names in every language."""
+    structure = {"order": {"lines": "array<object>"}, "invoice": {"lines": "array<object>"}}
+    python = generate_python_type("Root", structure)
+    assert "    lines: List[RootOrderLinesItem]" in python
+    assert "    lines: List[RootInvoiceLinesItem]" in python
+    typescript = generate_typescript_type("Root", structure)
+    assert "  lines: RootOrderLinesItem[];" in typescript
+    assert "  lines: RootInvoiceLinesItem[];" in typescript
+    golang = generate_golang_type("Root", structure)
+    assert "RootOrderLinesItem" in golang
+    assert "RootInvoiceLinesItem" in golang
+
+
+def test_generate_types_reuses_code_for_same_structure():
+    """Test that inputs with the same inferred structure share generated code."""
+    with patch("json_inspector.generate_python_type", return_value="py") as mock_python:
+        first = generate_types({"cached_types_field": "a"}, "Cached")
+        second = generate_types({"cached_types_field": "b"}, "Cached")
+
+    mock_python.assert_called_once()
+    assert first == second
@@ -1,7 +1,14 @@
 """Tests for the JSON AI Inspector mock data generation functionality."""
 
+import json
+import re
+import uuid
+from datetime import datetime
+
 import pytest
+from unittest.mock import patch
 from json_inspector import (
+    _analyze_json_structure,
     analyze_json_structure,
     generate_dummy_data,
     generate_dummy_object,
@@ -9,28 +16,9 @@ from json_inspector import (
 )
 
 
-@pytest.fixture
-def type_structure():
-    """Return a sample JSON structure with type definitions."""
-    return {
-        "id": "objectId",
-        "name": "string",
-        "email": "email",
-        "age": "integer",
-        "score": "number",
-        "active": "boolean",
-        "created": "date",
-        "tags": "array<string>",
-        "profile": {
-            "phone": "phone",
-            "website": "url"
-        }
-    }
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data():
-    """Return a sample JSON data for type inference."""
+    """Return a sample JSON data for type inference (shared, do not modify)."""
     return [
         {
             "id": "5f7b5e9b2d5a7c1234567890",
@@ -81,36 +69,58 @@ def test_analyze_json_structure_with_sample_data(sample_data):
     assert result["profile"]["website"] == "url"  # Based on format
 
 
-def test_generate_dummy_data_basic_types():
+@pytest.mark.parametrize("value_type, expected_class", [
+    ("string", str),
+    ("integer", int),
+    ("number", float),
+    ("boolean", bool),
+    ("date", str),
+    ("array<string>", list),
+])
+def test_generate_dummy_data_basic_types(value_type, expected_class):
     """Test generating dummy data for basic types."""
-    assert isinstance(generate_dummy_data("string"), str)
-    assert isinstance(generate_dummy_data("integer"), int)
-    assert isinstance(generate_dummy_data("number"), float)
-    assert isinstance(generate_dummy_data("boolean"), bool)
-    assert isinstance(generate_dummy_data("date"), str)
-    assert isinstance(generate_dummy_data("array<string>"), list)
+    assert isinstance(generate_dummy_data(value_type), expected_class)
 
 
-def test_generate_dummy_data_special_types():
-    """Test generating dummy data for special types."""
-    # ObjectId should be 24 hex characters
-    assert len(generate_dummy_data("objectId")) == 24
-    assert all(c in "0123456789abcdef" for c in generate_dummy_data("objectId"))
+# Formatos esperados de los valores dummy, compilados una sola vez
+OBJECTID_RE = re.compile(r"[0-9a-f]{24}")
+EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+PHONE_RE = re.compile(r"\+\d{9,}")
+URL_RE = re.compile(r"https?://[^ ]+\.[^ ]+")
 
-    # Email should have @ and domain
-    email = generate_dummy_data("email")
-    assert "@" in email
-    assert "." in email.split("@")[1]
 
+@pytest.mark.parametrize("value_type, pattern", [
+    # ObjectId should be 24 hex characters
+    pytest.param("objectId", OBJECTID_RE, id="objectId"),
+    # Email should have @ and domain
+    pytest.param("email", EMAIL_RE, id="email"),
     # Phone should be a valid format
-    phone = generate_dummy_data("phone")
-    assert phone.startswith("+")
-    assert len(phone) >= 10
-
+    pytest.param("phone", PHONE_RE, id="phone"),
     # URL should be valid
-    url = generate_dummy_data("url")
-    assert url.startswith("http")
-    assert "." in url
+    pytest.param("url", URL_RE, id="url"),
+])
+def test_generate_dummy_data_special_types(value_type, pattern):
+    """Test generating dummy data for special types."""
+    assert pattern.fullmatch(generate_dummy_data(value_type))
+
+
+# Clase esperada de cada campo generado a partir de type_structure
+RECORD_SCHEMA = (
+    ("id", str), ("name", str), ("email", str), ("age", int), ("score", float),
+    ("active", bool), ("created", str), ("tags", list), ("profile", dict),
+)
+PROFILE_SCHEMA = (("phone", str), ("website", str))
+
+
+def type_mismatches(record):
+    """Return the fields of a type_structure record whose class is wrong."""
+    mismatches = {key: type(record[key]).__name__ for key, cls in RECORD_SCHEMA if not isinstance(record[key], cls)}
+    if isinstance(record["profile"], dict):
+        mismatches.update(
+            (f"profile.{key}", type(record["profile"][key]).__name__)
+            for key, cls in PROFILE_SCHEMA if not isinstance(record["profile"][key], cls)
+        )
+    return mismatches
 
 
 def test_generate_dummy_object(type_structure):
@@ -119,43 +129,26 @@ def test_generate_dummy_object(type_structure):
     
     assert isinstance(result, dict)
     assert len(result) == len(type_structure)
-    assert isinstance(result["id"], str)
-    assert isinstance(result["name"], str)
-    assert isinstance(result["email"], str)
-    assert isinstance(result["age"], int)
-    assert isinstance(result["score"], float)
-    assert isinstance(result["active"], bool)
-    assert isinstance(result["created"], str)
-    assert isinstance(result["tags"], list)
-    assert isinstance(result["profile"], dict)
-    assert isinstance(result["profile"]["phone"], str)
-    assert isinstance(result["profile"]["website"], str)
+    assert type_mismatches(result) == {}
 
 
-def test_generate_mock_data_invalid_input():
+@pytest.mark.parametrize("payload, num_records, expected_error", [
+    pytest.param("{invalid json}", 5, "json inválido", id="invalid_json"),
+    pytest.param("", 5, "", id="empty_input"),
+    pytest.param("{}", 1001, "máximo", id="too_many_records"),
+])
+def test_generate_mock_data_invalid_input(payload, num_records, expected_error):
     """Test generating mock data with invalid input."""
-    # Invalid JSON
-    success, error, data = generate_mock_data("{invalid json}", 5)
-    assert not success
-    assert "JSON inválido" in error
-    assert data is None
-
-    # Empty input
-    success, error, data = generate_mock_data("", 5)
+    success, error, data = generate_mock_data(payload, num_records)
     assert not success
     assert error
-    assert data is None
-
-    # Invalid number of records
-    success, error, data = generate_mock_data("{}", 1001)
-    assert not success
-    assert "máximo" in error.lower()
+    assert expected_error in error.lower()
     assert data is None
 
 
-def test_generate_mock_data_valid_input(type_structure):
-    """Test generating mock data with valid input."""
-    num_records = 5
+@pytest.mark.parametrize("num_records", [0, 1, 5, 1000])
+def test_generate_mock_data_valid_input(type_structure, num_records):
+    """Test generating mock data with valid input, including the record limits."""
     success, error, data = generate_mock_data(type_structure, num_records)
     
     assert success
@@ -163,15 +156,93 @@ def test_generate_mock_data_valid_input(type_structure):
     assert isinstance(data, list)
     assert len(data) == num_records
     
+    assert [type_mismatches(record) for record in data] == [{}] * num_records
+
+
+def test_generate_mock_data_numeric_columns():
+    """Test that vectorized numeric fields stay in range and use native types."""
+    structure = {"age": 30, "score": 4.5, "active": True, "stats": {"count": 2}}
+    success, error, data = generate_mock_data(structure, 1000)
+
+    assert success
+    assert len(data) == 1000
+    assert all(type(record["age"]) is int and -1000 <= record["age"] <= 1000 for record in data)
+    assert all(type(record["score"]) is float and -1000 <= record["score"] <= 1000 for record in data)
+    assert all(type(record["active"]) is bool for record in data)
+    assert all(type(record["stats"]["count"]) is int for record in data)
+    assert {record["active"] for record in data} == {True, False}
+    assert list(data[0]) == list(structure)
+
+
+def test_generate_mock_data_empty_structure():
+    """Test that an empty object yields the requested number of empty records."""
+    success, error, data = generate_mock_data({}, 3)
+    assert success
+    assert data == [{}, {}, {}]
+
+
+def test_analyze_json_structure_is_cached():
+    """Test that repeated analysis reuses the cached result and returns copies."""
+    with patch("json_inspector._analyze_json_structure", wraps=_analyze_json_structure) as mock_analyze:
+        first = analyze_json_structure(json.dumps({"cached_field": 1}))
+        first["profile"] = "changed"
+        second = analyze_json_structure(json.dumps({"cached_field": 1}))
+
+    mock_analyze.assert_called_once()
+    assert "profile" not in second
+
+
+@pytest.mark.parametrize("to_input", [dict, json.dumps], ids=["dict", "text"])
+def test_analyze_json_structure_keeps_field_order(to_input):
+    """Test that inputs differing only in key order keep their own field order."""
+    assert list(analyze_json_structure(to_input({"order_b": 1, "order_a": "x"}))) == ["order_b", "order_a"]
+    assert list(analyze_json_structure(to_input({"order_a": "x", "order_b": 1}))) == ["order_a", "order_b"]
+    success, _, data = generate_mock_data(to_input({"order_a": "x", "order_b": 1}), 1)
+    assert success
+    assert list(data[0]) == ["order_a", "order_b"]
+
+
+def test_generate_mock_data_reuses_parsed_structure():
+    """Test that a string already analyzed is not parsed again."""
+    json_str = json.dumps({"reused_field": "value"})
+    analyze_json_structure(json_str)
+    with patch("json_inspector.loads_json") as mock_loads:
+        success, _, data = generate_mock_data(json_str, 2)
+
+    mock_loads.assert_not_called()
+    assert success
+    assert len(data) == 2
+
+
+def test_analyze_json_structure_deeply_nested():
+    """Test that nesting deeper than the recursion limit can be analyzed."""
+    data = {}
+    current = data
+    for _ in range(5000):
+        current["child"] = {}
+        current = current["child"]
+    current["name"] = "leaf"
+
+    structure = _analyze_json_structure(data)
+    for _ in range(5000):
+        structure = structure["child"]
+    assert structure == {"name": "string"}
+
+
+def test_generate_mock_data_string_columns():
+    """Test the formats of batch-generated string fields."""
+    structure = {
+        "id": "x",
+        "token": "123e4567-e89b-42d3-a456-426614174000",
+        "name": "x",
+        "created": "2025-04-19",
+    }
+    success, error, data = generate_mock_data(structure, 200)
+
+    assert success
     for record in data:
-        assert isinstance(record["id"], str)
-        assert isinstance(record["name"], str)
-        assert isinstance(record["email"], str)
-        assert isinstance(record["age"], int)
-        assert isinstance(record["score"], float)
-        assert isinstance(record["active"], bool)
-        assert isinstance(record["created"], str)
-        assert isinstance(record["tags"], list)
-        assert isinstance(record["profile"], dict)
-        assert isinstance(record["profile"]["phone"], str)
-        assert isinstance(record["profile"]["website"], str)
+        assert OBJECTID_RE.fullmatch(record["id"])
+        assert uuid.UUID(record["token"]).version == 4
+        assert 1 <= len(record["name"].split()) <= 4
+        assert datetime.strptime(record["created"], "%Y-%m-%d")
+    assert len({record["id"] for record in data}) == 200
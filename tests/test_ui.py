@@ -2,30 +2,69 @@
 
 import json
 import pytest
-import sys
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
 from unittest.mock import patch, MagicMock
 
-# Mock streamlit before importing app
-sys.modules['streamlit'] = MagicMock()
 
-# Now we can safely import our app
-from app import JSONInspectorUI
+# streamlit ya está sustituido por el stub de conftest.py
+import app
+from app import JSONInspectorUI, history_preview, history_timestamp
+from json_inspector import format_json
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Empty the Streamlit caches between tests."""
+    cached_functions = (
+        app.get_ai_cache, app.get_rate_limiter, app.cached_format_json, app.cached_compare_json,
+        app.cached_json_to_csv, app.cached_generate_types,
+    )
+    for func in cached_functions:
+        func.clear()
+    yield
+    for func in cached_functions:
+        func.clear()
+
+
+def groq_stream_response(*contents):
+    """Return a mocked streaming Groq response yielding the given chunks."""
+    mock_response = MagicMock()
+    mock_response.iter_lines.return_value = [
+        b"data: " + json.dumps(
+            {"choices": [{"delta": {"content": content}}]}
+        ).encode()
+        for content in contents
+    ] + [b"", b"data: [DONE]"]
+    return mock_response
+
+
+@contextmanager
+def patched_streamlit(*names, **return_values):
+    """Patch several Streamlit functions at once with a single ExitStack.
+
+    Positional names are patched with plain mocks; keyword arguments also set
+    the mock's return value. Yields the mocks keyed by name.
+    """
+    with ExitStack() as stack:
+        mocks = {name: stack.enter_context(patch(f"streamlit.{name}")) for name in names}
+        for name, value in return_values.items():
+            mocks[name] = stack.enter_context(patch(f"streamlit.{name}", return_value=value))
+        yield mocks
+
+
+@pytest.fixture(scope="session")
+def groq_response():
+    """Return a streaming Groq response answering "Test response", shared by the tests."""
+    return groq_stream_response("Test ", "response")
 
 
 @pytest.fixture
-def mock_streamlit():
-    """Mock all required Streamlit components."""
-    with patch("streamlit.sidebar") as mock_sidebar, \
-         patch("streamlit.title") as mock_title, \
-         patch("streamlit.markdown") as mock_markdown, \
-         patch("streamlit.session_state", new_callable=dict) as mock_state:
-        mock_sidebar.selectbox.return_value = "Español"
-        yield {
-            "sidebar": mock_sidebar,
-            "title": mock_title,
-            "markdown": mock_markdown,
-            "session_state": mock_state
-        }
+def groq_api_key(monkeypatch):
+    """Configure a test Groq API key in the environment."""
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    return "test_key"
 
 
 @pytest.fixture
@@ -34,230 +73,401 @@ def ui(mock_streamlit):
     return JSONInspectorUI()
 
 
+# Claves de traducción que deben existir en todos los idiomas
+REQUIRED_TEXT_KEYS = frozenset({"title", "json_input", "format_btn", "question_label"})
+
+
 def test_i18n_setup(ui):
     """Test that internationalization is properly set up."""
     assert "Español" in ui.texts
     assert "English" in ui.texts
-    assert all(
-        key in ui.texts["Español"]
-        for key in ["title", "json_input", "format_btn", "question_label"]
-    )
-    assert all(
-        key in ui.texts["English"]
-        for key in ["title", "json_input", "format_btn", "question_label"]
-    )
+    assert REQUIRED_TEXT_KEYS <= ui.texts["Español"].keys()
+    assert REQUIRED_TEXT_KEYS <= ui.texts["English"].keys()
 
 
 @pytest.mark.parametrize("lang", ["Español", "English"])
-def test_language_switch(mock_streamlit, lang):
+def test_language_switch(ui, lang):
     """Test that language switching works."""
-    mock_streamlit["sidebar"].selectbox.return_value = lang
-    ui = JSONInspectorUI()
+    ui.set_language(lang)
     assert ui.lang == lang
     assert ui.t == ui.texts[lang]
 
 
-def test_initialize_session_state(ui):
+@pytest.mark.parametrize("lang", ["Español", "English"])
+def test_header_donate_text(mock_streamlit, lang):
+    """Test that the header shows the donation text in the selected language."""
+    mock_streamlit["sidebar"].selectbox.return_value = lang
+    JSONInspectorUI()
+    html = mock_streamlit["markdown"].call_args[0][0]
+    assert html == app.DONATE_HTML[lang]
+    assert app.TEXTS[lang]["donate"] in html
+
+
+def test_initialize_session_state(ui, session_state):
     """Test that session state is properly initialized."""
-    with patch('streamlit.session_state', {}) as mock_state:
-        ui.initialize_session_state()
-        assert "json_history" in mock_state
-        assert "ia_uses" in mock_state
-        assert isinstance(mock_state["json_history"], list)
-        assert mock_state["ia_uses"] == 0
+    session_state.clear()
+    ui.initialize_session_state()
+    assert "json_history" in session_state
+    assert "ia_uses" in session_state
+    assert isinstance(session_state["json_history"], deque)
+    assert session_state["json_history"].maxlen == 50
+    assert session_state["ia_uses"] == 0
 
 
-def test_ask_ai_without_api_key(ui):
+def test_ask_ai_without_api_key(ui, monkeypatch):
     """Test that ask_ai raises an error when API key is not configured."""
-    with patch.dict("os.environ", {}, clear=True), \
-         patch("streamlit.secrets", {}):
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    with patch("streamlit.secrets", {}):
         with pytest.raises(ValueError) as exc_info:
             ui.ask_ai("test question", {"test": "data"})
         assert "API key" in str(exc_info.value)
 
 
-@patch.dict("os.environ", {"GROQ_API_KEY": "test_key"})
-def test_ask_ai_with_api_key(ui):
+def test_ask_ai_with_api_key(ui, groq_api_key, groq_response):
     """Test that ask_ai makes the correct API call when API key is configured."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "choices": [{"message": {"content": "Test response"}}]
-    }
-
-    with patch("requests.post", return_value=mock_response) as mock_post:
+    with patch("requests.Session.post", return_value=groq_response) as mock_post:
         response = ui.ask_ai("test question", {"test": "data"})
         
         assert response == "Test response"
         mock_post.assert_called_once()
         assert mock_post.call_args[0][0] == "https://api.groq.com/openai/v1/chat/completions"
-        assert "Bearer test_key" in mock_post.call_args[1]["headers"]["Authorization"]
+        assert f"Bearer {groq_api_key}" in mock_post.call_args[1]["headers"]["Authorization"]
+        assert mock_post.call_args[1]["timeout"]
+        assert mock_post.call_args[1]["stream"] is True
+        payload = json.loads(mock_post.call_args[1]["data"])
+        assert payload["stream"] is True
+        assert payload["model"] == "llama-3.3-70b-versatile"
+        assert payload["messages"][0]["role"] == "system"
+        prompt = payload["messages"][-1]["content"]
+        assert '{"test":"data"}' in prompt
+
+
+def test_ask_ai_caches_repeated_questions(ui, session_state, groq_api_key, groq_response):
+    """Test that repeating a question about the same JSON reuses the answer."""
+    with patch("requests.Session.post", return_value=groq_response) as mock_post:
+        first = ui.ask_ai("test question", {"test": "data"})
+        second = ui.ask_ai("test question", {"test": "data"})
+
+        assert first == second == "Test response"
+        mock_post.assert_called_once()
+        assert session_state["ia_uses"] == 1
+
+        ui.ask_ai("test question", {"test": "other"})
+        assert mock_post.call_count == 2
 
 
-def test_format_section_with_valid_json(ui, valid_json):
+def test_ai_cache_is_shared_and_expires(ui, groq_api_key, groq_response):
+    """Test that cached answers survive a new UI instance until the TTL passes."""
+    with patch("requests.Session.post", return_value=groq_response) as mock_post:
+        ui.ask_ai("test question", {"test": "data"})
+        JSONInspectorUI().ask_ai("test question", {"test": "data"})
+        mock_post.assert_called_once()
+
+        with patch("app.time.time", return_value=app.time.time() + app.AI_CACHE_TTL + 1):
+            ui.ask_ai("test question", {"test": "data"})
+        assert mock_post.call_count == 2
+
+    key = app.ai_cache_key(groq_api_key, "test question", {"test": "data"})
+    assert groq_api_key not in key
+
+
+def test_ask_ai_stream_yields_chunks(ui, groq_api_key):
+    """Test that ask_ai_stream yields the answer as it arrives."""
+    mock_response = groq_stream_response("Hola", ", ", "mundo")
+
+    with patch("requests.Session.post", return_value=mock_response):
+        assert list(ui.ask_ai_stream("test question", {"a": 1})) == ["Hola", ", ", "mundo"]
+        # La segunda vez se responde desde la caché en un solo fragmento
+        assert list(ui.ask_ai_stream("test question", {"a": 1})) == ["Hola, mundo"]
+
+
+def test_ask_ai_stream_drains_and_closes_response(ui, groq_api_key):
+    """Test that the streamed response is read to the end and closed."""
+    mock_response = groq_stream_response("Hola")
+    lines = iter(mock_response.iter_lines.return_value + [b""])
+    mock_response.iter_lines.return_value = lines
+
+    with patch("requests.Session.post", return_value=mock_response):
+        assert list(ui.ask_ai_stream("test question", {"a": 1})) == ["Hola"]
+    # Lo que llega después de [DONE] también se consume
+    assert next(lines, None) is None
+    mock_response.__exit__.assert_called_once()
+
+
+def test_ask_ai_stream_closes_response_on_http_error(ui, groq_api_key):
+    """Test that the response is closed when the request fails."""
+    mock_response = groq_stream_response()
+    mock_response.raise_for_status.side_effect = RuntimeError("500")
+
+    with patch("requests.Session.post", return_value=mock_response):
+        with pytest.raises(RuntimeError):
+            list(ui.ask_ai_stream("test question", {"a": 1}))
+    mock_response.__exit__.assert_called_once()
+
+
+def test_ask_ai_rate_limited(ui, groq_api_key, groq_response):
+    """Test that questions beyond the per-minute budget are rejected locally."""
+    limiter = app.get_rate_limiter()
+    limiter.tokens = 1
+    with patch("requests.Session.post", return_value=groq_response) as mock_post:
+        assert ui.ask_ai("first question", {"a": 1}) == "Test response"
+        with pytest.raises(ValueError, match=ui.t["rate_limit_msg"]):
+            ui.ask_ai("second question", {"a": 1})
+        # Las respuestas en caché no consumen tokens
+        assert ui.ask_ai("first question", {"a": 1}) == "Test response"
+    mock_post.assert_called_once()
+
+
+def test_token_bucket_refills_over_time():
+    """Test that the token bucket refills at the configured rate."""
+    bucket = app.TokenBucket(per_minute=60)
+    with patch("app.time.monotonic", return_value=bucket.updated):
+        assert all(bucket.try_acquire() for _ in range(60))
+        assert not bucket.try_acquire()
+    with patch("app.time.monotonic", return_value=bucket.updated + 1):
+        assert bucket.try_acquire()
+
+
+def test_groq_session_retries_transient_errors():
+    """Test that the shared Groq session retries rate limits and server errors."""
+    assert app.get_session() is app.get_session()
+    retry = app.get_session().get_adapter(app.GROQ_API_URL).max_retries
+    assert retry.total == 3
+    assert 429 in retry.status_forcelist
+    assert "POST" in retry.allowed_methods
+
+
+def test_format_section_with_valid_json(ui, session_state, valid_json):
     """Test JSON formatting section with valid input."""
-    with patch("streamlit.header"), \
-         patch("streamlit.text_area", return_value=valid_json), \
-         patch("streamlit.button", return_value=True), \
-         patch("streamlit.code") as mock_code, \
-         patch("streamlit.success") as mock_success, \
-         patch("streamlit.session_state", new_callable=dict) as mock_state:
-        
-        mock_state["json_history"] = []
+    session_state["json_history"] = []
+    with patched_streamlit("header", "code", "success", text_area=valid_json, button=True) as st_mocks:
         ui.format_section()
-        
-        mock_code.assert_called_once()
-        assert mock_success.call_count == 2  # Se llama dos veces: una para el formato y otra para el guardado
-        assert len(mock_state["json_history"]) == 1
+
+    mock_code = st_mocks["code"]
+    mock_code.assert_called_once()
+    assert st_mocks["success"].call_count == 2  # Se llama dos veces: una para el formato y otra para el guardado
+    assert len(session_state["json_history"]) == 1
+    entry = session_state["json_history"][0]
+    assert isinstance(entry["ts"], float)
+    assert entry["formatted"] == mock_code.call_args[0][0]
+    # Solo se guarda el texto formateado, no una segunda copia parseada
+    assert entry.keys() == {"id", "ts", "formatted"}
 
 
 def test_format_section_with_invalid_json(ui, invalid_json):
     """Test JSON formatting section with invalid input."""
-    with patch("streamlit.header"), \
-         patch("streamlit.text_area", return_value=invalid_json), \
-         patch("streamlit.button", return_value=True), \
-         patch("streamlit.error") as mock_error:
-        
+    with patched_streamlit("header", "error", text_area=invalid_json, button=True) as st_mocks:
+        ui.format_section()
+    st_mocks["error"].assert_called_once()
+
+
+def test_format_section_reuses_result_for_same_input(ui, session_state, valid_json):
+    """Test that formatting the same input twice parses it only once."""
+    session_state["json_history"] = []
+    with patched_streamlit("header", "code", "success", text_area=valid_json, button=True), \
+         patch("app.format_json", wraps=format_json) as mock_format:
+        ui.format_section()
         ui.format_section()
-        mock_error.assert_called_once()
+
+    mock_format.assert_called_once_with(valid_json)
+    assert len(session_state["json_history"]) == 2
+
+
+class FakeColumn:
+    """Streamlit column whose text area always returns the given value."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def text_area(self, *args, **kwargs):
+        return self.value
+
+
+def compare_columns(json_a, json_b):
+    """Return the two columns of the comparison section."""
+    return [FakeColumn(json_a), FakeColumn(json_b)]
 
 
 def test_compare_section_with_equal_jsons(ui, valid_json):
     """Test JSON comparison section with equal inputs."""
-    with patch("streamlit.header"), \
-         patch("streamlit.columns") as mock_columns, \
-         patch("streamlit.button", return_value=True), \
-         patch("streamlit.success") as mock_success, \
-         patch("streamlit.json") as mock_json:
-        
-        col1, col2 = MagicMock(), MagicMock()
-        col1.text_area.return_value = valid_json
-        col2.text_area.return_value = valid_json
-        mock_columns.return_value = [col1, col2]
-        
+    columns = compare_columns(valid_json, valid_json)
+    with patched_streamlit("header", "success", "json", columns=columns, button=True) as st_mocks:
         ui.compare_section()
-        mock_success.assert_called_once()
-        mock_json.assert_not_called()
+    st_mocks["success"].assert_called_once()
+    st_mocks["json"].assert_not_called()
 
 
-def test_compare_section_with_different_jsons(ui, valid_json, complex_json):
+def test_compare_section_with_different_jsons(ui, session_state, valid_json, complex_json):
     """Test JSON comparison section with different inputs."""
-    with patch("streamlit.header"), \
-         patch("streamlit.columns") as mock_columns, \
-         patch("streamlit.button", return_value=True), \
-         patch("streamlit.error") as mock_error, \
-         patch("streamlit.json") as mock_json, \
-         patch("streamlit.session_state", new_callable=dict) as mock_state:
-        
-        mock_state["json_history"] = []
-        col1, col2 = MagicMock(), MagicMock()
-        col1.text_area.return_value = valid_json
-        col2.text_area.return_value = complex_json
-        mock_columns.return_value = [col1, col2]
-        
+    session_state["json_history"] = []
+    columns = compare_columns(valid_json, complex_json)
+    with patched_streamlit("header", "error", "json", columns=columns, button=True) as st_mocks:
         ui.compare_section()
-        mock_error.assert_called_once()
-        mock_json.assert_called_once()
+    st_mocks["error"].assert_called_once()
+    st_mocks["json"].assert_called_once()
 
 
-@pytest.fixture
-def type_structure():
-    """Return a sample JSON structure with type definitions."""
-    return {
-        "id": "objectId",
-        "name": "string",
-        "email": "email",
-        "age": "integer",
-        "score": "number",
-        "active": "boolean",
-        "created": "date",
-        "tags": "array<string>",
-        "profile": {
-            "phone": "phone",
-            "website": "url"
-        }
-    }
-
-
-def test_mock_data_section_with_valid_input(ui, type_structure):
+def test_compare_section_caps_differences(ui):
+    """Test that the comparison stops at COMPARE_MAX_DIFFS and says so."""
+    columns = compare_columns('{"a": 1, "b": 2, "c": 3}', '{"a": 0, "b": 0, "c": 0}')
+    with patch("app.COMPARE_MAX_DIFFS", 2), patched_streamlit(
+        "header", "error", "info", "json", columns=columns, button=True
+    ) as st_mocks:
+        ui.compare_section()
+    assert len(st_mocks["json"].call_args.args[0]) == 2
+    st_mocks["info"].assert_called_once_with(ui.t["diff_limit_msg"].format(count=2))
+
+
+@pytest.mark.parametrize("selected", [[], [0], [3]])
+def test_render_history_table(ui, mock_streamlit, session_state, selected):
+    """Test that history is one table and only the selected entry is rendered."""
+    start = datetime(2025, 4, 19, 10, 0, 0).timestamp()
+    session_state["json_history"] = deque(
+        ({"id": i + 1, "ts": start + i, "formatted": f'{{"i": {i}}}'} for i in range(25)),
+        maxlen=app.HISTORY_MAX_SIZE,
+    )
+    mock_sidebar = mock_streamlit["sidebar"]
+    mock_sidebar.button.return_value = False
+    mock_sidebar.dataframe.return_value.selection.rows = selected
+    columns = [MagicMock(), MagicMock(), MagicMock()]
+    for column in columns:
+        column.button.return_value = False
+
+    with patched_streamlit("code", columns=columns, button=False) as st_mocks:
+        ui.render_history()
+    mock_code = st_mocks["code"]
+
+    mock_sidebar.expander.assert_not_called()
+    mock_sidebar.dataframe.assert_called_once()
+    table = mock_sidebar.dataframe.call_args[0][0]
+    dates = table[ui.t["history_date_col"]]
+    assert len(dates) == 25
+    assert dates[0] == "2025-04-19 10:00:24"
+    if selected:
+        index = 24 - selected[0]
+        mock_code.assert_called_once_with(f'{{"i": {index}}}', language="json")
+    else:
+        mock_code.assert_not_called()
+
+
+def test_render_history_ai_question_parses_latest_entry(ui, mock_streamlit, session_state):
+    """Test that the AI assistant re-parses the latest entry's formatted JSON."""
+    session_state["json_history"] = deque([{"id": 1, "ts": 0.0, "formatted": '{\n  "a": 1\n}'}])
+    session_state["show_ai_expander"] = True
+    mock_sidebar = mock_streamlit["sidebar"]
+    mock_sidebar.button.return_value = False
+    mock_sidebar.dataframe.return_value.selection.rows = []
+    columns = [MagicMock(), MagicMock(), MagicMock()]
+    for column in columns:
+        column.button.return_value = False
+
+    with patched_streamlit("code", "markdown", "write_stream", columns=columns, button=True,
+                           text_input="¿Qué campos tiene?"), \
+         patch.object(ui, "ask_ai_stream") as mock_ask:
+        ui.render_history()
+    mock_ask.assert_called_once_with("¿Qué campos tiene?", {"a": 1})
+
+
+def test_render_history_selection_cleared_when_entry_added(ui, mock_streamlit, session_state, valid_json):
+    """Test that a selected row does not point to another entry after a new one is added."""
+    session_state["json_history"] = deque(maxlen=2)
+    # Streamlit guarda la selección por clave del widget y por posición de fila
+    selections = {}
+
+    def fake_dataframe(data, key, **kwargs):
+        event = MagicMock()
+        event.selection.rows = selections.get(key, [])
+        return event
+
+    mock_sidebar = mock_streamlit["sidebar"]
+    mock_sidebar.button.return_value = False
+    mock_sidebar.dataframe.side_effect = fake_dataframe
+    columns = [MagicMock(), MagicMock(), MagicMock()]
+    for column in columns:
+        column.button.return_value = False
+
+    with patched_streamlit("header", "success", "code", text_area=valid_json, button=True):
+        ui.format_section()
+        ui.format_section()
+    with patched_streamlit("code", columns=columns, button=False) as st_mocks:
+        ui.render_history()
+        # El usuario selecciona la fila más reciente
+        selections[mock_sidebar.dataframe.call_args.kwargs["key"]] = [0]
+        ui.render_history()
+    clicked = session_state["json_history"][-1]
+    st_mocks["code"].assert_called_once_with(clicked["formatted"], language="json")
+
+    # Una entrada nueva desplaza las posiciones y descarta la más antigua
+    with patched_streamlit("header", "success", "code", text_area='{"new": 1}', button=True):
+        ui.format_section()
+    with patched_streamlit("code", columns=columns, button=False) as st_mocks:
+        ui.render_history()
+    st_mocks["code"].assert_not_called()
+    assert clicked in session_state["json_history"]
+
+
+def test_render_json_preview_truncates_large_entries(ui):
+    """Test that large history entries show a cached, truncated preview."""
+    item = {"formatted": "x" * (app.JSON_PREVIEW_LIMIT + 10)}
+    with patched_streamlit("code", checkbox=False) as st_mocks:
+        ui.render_json_preview(item, "big")
+    shown = st_mocks["code"].call_args[0][0]
+    assert shown == history_preview(item) == item["preview"]
+    assert len(shown) == app.JSON_PREVIEW_LIMIT + len("\n...")
+
+
+def test_history_timestamp_is_formatted_once():
+    """Test that the history label is formatted lazily and cached on the entry."""
+    item = {"ts": datetime(2025, 4, 19, 10, 30, 5).timestamp()}
+    assert history_timestamp(item) == "2025-04-19 10:30:05"
+    assert item["timestamp"] == "2025-04-19 10:30:05"
+
+
+# Componentes de la sección de datos dummy que no se comprueban
+MOCK_SECTION_WIDGETS = ("header", "write", "expander", "success", "error", "json", "download_button")
+
+
+def test_mock_data_section_with_valid_input(ui, session_state, type_structure_json):
     """Test mock data generation section with valid input."""
-    with patch("streamlit.header"), \
-         patch("streamlit.write"), \
-         patch("streamlit.expander") as mock_expander, \
-         patch("streamlit.text_area", return_value=json.dumps(type_structure)), \
-         patch("streamlit.number_input", return_value=5), \
-         patch("streamlit.button", return_value=True), \
-         patch("streamlit.success") as mock_success, \
-         patch("streamlit.json") as mock_json, \
-         patch("streamlit.download_button") as mock_download, \
-         patch("streamlit.session_state", new_callable=dict) as mock_state:
-        
-        mock_state["mock_data_history"] = []
-        mock_expander.__enter__ = MagicMock()
-        mock_expander.__exit__ = MagicMock()
-        
+    session_state["mock_data_history"] = []
+    with patched_streamlit(*MOCK_SECTION_WIDGETS, text_area=type_structure_json,
+                           number_input=5, button=True) as st_mocks:
         ui.mock_data_section()
-        
-        mock_success.assert_called_once()
-        mock_json.assert_called_once()
-        mock_download.assert_called_once()
-        assert len(mock_state["mock_data_history"]) == 1
+
+    st_mocks["success"].assert_called_once()
+    st_mocks["json"].assert_called_once()
+    st_mocks["download_button"].assert_called_once()
+    assert len(session_state["mock_data_history"]) == 1
 
 
 def test_mock_data_section_with_invalid_json(ui):
     """Test mock data generation section with invalid JSON."""
-    with patch("streamlit.header"), \
-         patch("streamlit.write"), \
-         patch("streamlit.expander") as mock_expander, \
-         patch("streamlit.text_area", return_value="{invalid json}"), \
-         patch("streamlit.number_input", return_value=5), \
-         patch("streamlit.button", return_value=True), \
-         patch("streamlit.error") as mock_error:
-        
-        mock_expander.__enter__ = MagicMock()
-        mock_expander.__exit__ = MagicMock()
-        
+    with patched_streamlit(*MOCK_SECTION_WIDGETS, text_area="{invalid json}",
+                           number_input=5, button=True) as st_mocks:
         ui.mock_data_section()
-        mock_error.assert_called_once()
+    st_mocks["error"].assert_called_once()
 
 
-def test_mock_data_section_with_invalid_records(ui, type_structure):
+def test_mock_data_section_with_invalid_records(ui, type_structure_json):
     """Test mock data generation section with invalid number of records."""
-    with patch("streamlit.header"), \
-         patch("streamlit.write"), \
-         patch("streamlit.expander") as mock_expander, \
-         patch("streamlit.text_area", return_value=json.dumps(type_structure)), \
-         patch("streamlit.number_input", return_value=1001), \
-         patch("streamlit.button", return_value=True), \
-         patch("streamlit.error") as mock_error:
-        
-        mock_expander.__enter__ = MagicMock()
-        mock_expander.__exit__ = MagicMock()
-        
+    with patched_streamlit(*MOCK_SECTION_WIDGETS, text_area=type_structure_json,
+                           number_input=1001, button=True) as st_mocks:
         ui.mock_data_section()
-        mock_error.assert_called_once()
+    st_mocks["error"].assert_called_once()
 
 
-def test_mock_data_history(ui, type_structure):
+@pytest.mark.parametrize("runs", [2, 10])
+def test_mock_data_history(ui, session_state, type_structure_json, runs):
     """Test mock data history functionality."""
-    with patch("streamlit.header"), \
-         patch("streamlit.write"), \
-         patch("streamlit.expander") as mock_expander, \
-         patch("streamlit.text_area", return_value=json.dumps(type_structure)), \
-         patch("streamlit.number_input", return_value=5), \
-         patch("streamlit.button", return_value=True), \
-         patch("streamlit.success"), \
-         patch("streamlit.json"), \
-         patch("streamlit.download_button"), \
-         patch("streamlit.session_state", new_callable=dict) as mock_state:
-        
-        # Inicializar historial vacío
-        mock_state["mock_data_history"] = []
-        mock_expander.__enter__ = MagicMock()
-        mock_expander.__exit__ = MagicMock()
-        
-        # Generar datos dos veces
-        ui.mock_data_section()
-        ui.mock_data_section()
-        
-        # Verificar que se guardaron dos conjuntos de datos
-        assert len(mock_state["mock_data_history"]) == 2
+    # Inicializar historial vacío
+    session_state["mock_data_history"] = []
+    with patched_streamlit(*MOCK_SECTION_WIDGETS, text_area=type_structure_json,
+                           number_input=5, button=True):
+        # Generar datos varias veces
+        for _ in range(runs):
+            ui.mock_data_section()
+
+    # Verificar que se guardó un conjunto de datos por generación
+    assert len(session_state["mock_data_history"]) == runs
+    for item in session_state["mock_data_history"]:
+        assert json.loads(item["json_pretty"]) == item["json"]